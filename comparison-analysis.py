@@ -5,175 +5,391 @@ Shows the differences in coverage and results between the two approaches.
 """
 
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
+import numpy as np
 from datetime import datetime
+from functools import lru_cache
+from types import SimpleNamespace
 import os
-import glob
+import sys
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow is optional; fall back to pandas' parser
+    pa = None
+    pacsv = None
+    pq = None
+
+# Columns actually used by the analyses below
+RESULT_COLUMNS = ['symbol', 'company_name', 'sector', 'percent_change', 'market_cap']
+
+# Market cap buckets: <$2B, $2B-$10B, $10B-$200B, $200B+ (lower bound inclusive)
+MARKET_CAP_THRESHOLDS = np.array([2e9, 10e9, 200e9])
+MARKET_CAP_LABELS = [
+    "Small Cap (<$2B)",
+    "Mid Cap ($2B-$10B)",
+    "Large Cap ($10B-$200B)",
+    "Mega Cap (>$200B)",
+]
+
+def read_results_table(path):
+    """Parse an analysis CSV into a pyarrow Table with the column types the report expects."""
+    return pacsv.read_csv(
+        path,
+        read_options=pacsv.ReadOptions(use_threads=True, block_size=8 << 20),
+        convert_options=pacsv.ConvertOptions(
+            column_types={
+                'symbol': pa.string(),
+                'sector': pa.string(),
+                'market_cap': pa.float64(),
+                'percent_change': pa.float64(),
+            },
+            strings_can_be_null=True,  # Empty cells load as nulls, as with pd.read_csv
+        ),
+    )
+
+def read_results_csv(path):
+    """Read an analysis CSV, using pyarrow's multithreaded parser when available."""
+    if pacsv is not None:
+        try:
+            return read_results_table(path).to_pandas()
+        except Exception:
+            pass
+    return pd.read_csv(path)
+
+@lru_cache(maxsize=8)
+def _read_results_cached(path, mtime_ns):
+    """Read a result file; keyed on mtime so rewritten files are re-read."""
+    if path.endswith('.parquet'):
+        data = pd.read_parquet(path, columns=RESULT_COLUMNS, engine='pyarrow')
+    else:
+        data = read_results_csv(path)
+    
+    # Low-cardinality column: integer codes make value_counts/isin cheap.
+    # Categories keep first-appearance order so value_counts breaks ties as before.
+    sectors = data['sector']
+    data['sector'] = sectors.astype(pd.CategoricalDtype(sectors.dropna().unique()))
+    return data
+
+def has_result_rows(path):
+    """
+    Check whether a result file holds any rows without reading its columns.
+    
+    Parquet row counts come from the file footer; for CSV files only the header
+    and the first data line are read.
+    """
+    if path.endswith('.parquet'):
+        return pq.ParquetFile(path).metadata.num_rows > 0
+    
+    with open(path, 'r', encoding='utf-8') as f:
+        f.readline()
+        return any(line.strip() for line in f)
+
+def read_results(path):
+    """
+    Read an analysis result file, projecting Parquet files to the used columns.
+    
+    Frames are memoized per (path, mtime), so repeated reports in one process
+    skip the disk read. Callers must treat the returned frame as read-only.
+    Returns None for a file without data rows.
+    """
+    if not has_result_rows(path):
+        return None
+    return _read_results_cached(path, os.stat(path).st_mtime_ns)
+
+def convert_results_to_parquet(csv_path):
+    """
+    One-time migration of an analysis CSV to a zstd-compressed Parquet file.
+    
+    Args:
+        csv_path: Path to a sp500_drops_*.csv or fortune5000_drops_*.csv file
+        
+    Returns:
+        Path of the written Parquet file
+    """
+    if pq is None:
+        raise ImportError("pyarrow is required to write Parquet files")
+    
+    parquet_path = os.path.splitext(csv_path)[0] + '.parquet'
+    pq.write_table(read_results_table(csv_path), parquet_path, compression='zstd')
+    return parquet_path
+
+def find_latest_results():
+    """
+    Find the newest S&P 500 and Fortune 5000 result files in a single directory pass.
+    
+    Returns:
+        Tuple of (sp500_path, fortune5000_path); either may be None
+    """
+    extensions = ('.csv', '.parquet') if pq is not None else ('.csv',)
+    latest = {'sp500_drops_': (None, -1.0), 'fortune5000_drops_': (None, -1.0)}
+    
+    with os.scandir('.') as entries:
+        for entry in entries:
+            name = entry.name
+            if not name.endswith(extensions):
+                continue
+            
+            for prefix, (_, best_ctime) in latest.items():
+                if name.startswith(prefix):
+                    ctime = entry.stat().st_ctime
+                    if ctime > best_ctime:
+                        latest[prefix] = (name, ctime)
+                    break
+    
+    return latest['sp500_drops_'][0], latest['fortune5000_drops_'][0]
 
 def load_latest_results():
     """Load the most recent analysis results from both approaches."""
     
-    # Find the latest S&P 500 results
-    sp500_files = glob.glob("sp500_drops_*.csv")
-    fortune5000_files = glob.glob("fortune5000_drops_*.csv")
+    latest_sp500, latest_fortune5000 = find_latest_results()
     
     sp500_data = None
     fortune5000_data = None
     
-    if sp500_files:
-        latest_sp500 = max(sp500_files, key=os.path.getctime)
-        sp500_data = pd.read_csv(latest_sp500)
-        print(f"Loaded S&P 500 data from: {latest_sp500}")
+    if latest_sp500:
+        sp500_data = read_results(latest_sp500)
+        if sp500_data is not None:
+            print(f"Loaded S&P 500 data from: {latest_sp500}")
+        else:
+            print(f"Skipping empty S&P 500 results: {latest_sp500}")
     
-    if fortune5000_files:
-        latest_fortune5000 = max(fortune5000_files, key=os.path.getctime)
-        fortune5000_data = pd.read_csv(latest_fortune5000)
-        print(f"Loaded Fortune 5000 data from: {latest_fortune5000}")
+    if latest_fortune5000:
+        fortune5000_data = read_results(latest_fortune5000)
+        if fortune5000_data is not None:
+            print(f"Loaded Fortune 5000 data from: {latest_fortune5000}")
+        else:
+            print(f"Skipping empty Fortune 5000 results: {latest_fortune5000}")
     
     return sp500_data, fortune5000_data
 
-def analyze_coverage_differences(sp500_data, fortune5000_data):
+def unique_symbols(data):
+    """Return the distinct ticker symbols of a result frame as a hashed pd.Index."""
+    return pd.Index(data['symbol'].unique())
+
+def summarize_results(data):
+    """
+    Compute every aggregate the report needs from a result frame in one pass per column.
+    
+    Args:
+        data: Result DataFrame as returned by load_latest_results
+        
+    Returns:
+        SimpleNamespace with row count, sector counts, drop statistics,
+        market cap bucket counts and the distinct symbols
+    """
+    cap_counts = pd.Series(categorize_market_caps(data['market_cap'])).value_counts()
+    
+    # Drop unused categories and use a plain index so sectors from both
+    # frames align and sort alphabetically
+    sector_counts = data['sector'].value_counts()
+    sector_counts = sector_counts[sector_counts > 0]
+    sector_counts.index = sector_counts.index.astype(object)
+    
+    # Reduce on the raw ndarray instead of dispatching through pandas
+    pct = data['percent_change'].to_numpy(dtype=float)
+    pct = pct[~np.isnan(pct)]
+    
+    return SimpleNamespace(
+        n=len(data),
+        sector_counts=sector_counts,
+        pct_mean=pct.mean() if pct.size else np.nan,
+        pct_min=pct.min() if pct.size else np.nan,
+        cap_counts=cap_counts[cap_counts > 0],
+        symbols=unique_symbols(data),
+    )
+
+def build_report_context(sp500_data, fortune5000_data):
+    """
+    Build everything the report sections share, once per report.
+    
+    Args:
+        sp500_data: S&P 500 result DataFrame or None
+        fortune5000_data: Fortune 5000 result DataFrame or None
+        
+    Returns:
+        SimpleNamespace with per-frame summaries (None for a missing frame), the
+        Fortune 5000 frame and, when both frames exist, the symbol overlap count
+        and a row mask of Fortune 5000 drops absent from the S&P 500 results
+    """
+    ctx = SimpleNamespace(
+        sp500=summarize_results(sp500_data) if sp500_data is not None else None,
+        fortune5000=summarize_results(fortune5000_data) if fortune5000_data is not None else None,
+        fortune5000_data=fortune5000_data,
+        compared=sp500_data is not None and fortune5000_data is not None,
+        overlap_count=0,
+        unique_to_fortune5000_mask=None,
+    )
+    
+    if ctx.compared:
+        ctx.overlap_count = int(ctx.fortune5000.symbols.isin(ctx.sp500.symbols).sum())
+        ctx.unique_to_fortune5000_mask = ~fortune5000_data['symbol'].isin(ctx.sp500.symbols).to_numpy()
+    
+    return ctx
+
+def analyze_coverage_differences(ctx):
     """Analyze the differences in coverage between S&P 500 and Fortune 5000."""
     
-    print("\n" + "="*80)
-    print("COVERAGE ANALYSIS: S&P 500 vs Fortune 5000")
-    print("="*80)
+    sp500_summary, fortune5000_summary = ctx.sp500, ctx.fortune5000
+    
+    lines = ["\n" + "="*80, "COVERAGE ANALYSIS: S&P 500 vs Fortune 5000", "="*80]
     
-    if sp500_data is not None:
-        print(f"S&P 500 Analysis:")
-        print(f"  • Companies with significant drops: {len(sp500_data)}")
-        print(f"  • Sectors covered: {sp500_data['sector'].nunique()}")
-        print(f"  • Average drop: {sp500_data['percent_change'].mean():.2f}%")
-        print(f"  • Largest drop: {sp500_data['percent_change'].min():.2f}%")
+    if sp500_summary is not None:
+        lines.append(f"S&P 500 Analysis:")
+        lines.append(f"  • Companies with significant drops: {sp500_summary.n}")
+        lines.append(f"  • Sectors covered: {len(sp500_summary.sector_counts)}")
+        lines.append(f"  • Average drop: {sp500_summary.pct_mean:.2f}%")
+        lines.append(f"  • Largest drop: {sp500_summary.pct_min:.2f}%")
         
         # Top sectors by number of drops
-        sp500_sectors = sp500_data['sector'].value_counts().head(5)
-        print(f"  • Top sectors with drops:")
+        sp500_sectors = sp500_summary.sector_counts.head(5)
+        lines.append(f"  • Top sectors with drops:")
         for sector, count in sp500_sectors.items():
-            print(f"    - {sector}: {count} companies")
+            lines.append(f"    - {sector}: {count} companies")
     
-    if fortune5000_data is not None:
-        print(f"\nFortune 5000 Analysis:")
-        print(f"  • Companies with significant drops: {len(fortune5000_data)}")
-        print(f"  • Sectors covered: {fortune5000_data['sector'].nunique()}")
-        print(f"  • Average drop: {fortune5000_data['percent_change'].mean():.2f}%")
-        print(f"  • Largest drop: {fortune5000_data['percent_change'].min():.2f}%")
+    if fortune5000_summary is not None:
+        lines.append(f"\nFortune 5000 Analysis:")
+        lines.append(f"  • Companies with significant drops: {fortune5000_summary.n}")
+        lines.append(f"  • Sectors covered: {len(fortune5000_summary.sector_counts)}")
+        lines.append(f"  • Average drop: {fortune5000_summary.pct_mean:.2f}%")
+        lines.append(f"  • Largest drop: {fortune5000_summary.pct_min:.2f}%")
         
         # Top sectors by number of drops
-        fortune5000_sectors = fortune5000_data['sector'].value_counts().head(5)
-        print(f"  • Top sectors with drops:")
+        fortune5000_sectors = fortune5000_summary.sector_counts.head(5)
+        lines.append(f"  • Top sectors with drops:")
         for sector, count in fortune5000_sectors.items():
-            print(f"    - {sector}: {count} companies")
+            lines.append(f"    - {sector}: {count} companies")
     
-    if sp500_data is not None and fortune5000_data is not None:
+    if ctx.compared:
         # Find unique opportunities in Fortune 5000
-        sp500_symbols = set(sp500_data['symbol'].tolist()) if sp500_data is not None else set()
-        fortune5000_symbols = set(fortune5000_data['symbol'].tolist())
+        overlap = ctx.overlap_count
+        unique_to_fortune5000 = len(fortune5000_summary.symbols) - overlap
         
-        unique_to_fortune5000 = fortune5000_symbols - sp500_symbols
-        overlap = sp500_symbols & fortune5000_symbols
-        
-        print(f"\nOverlap Analysis:")
-        print(f"  • Companies in both analyses: {len(overlap)}")
-        print(f"  • Additional opportunities in Fortune 5000: {len(unique_to_fortune5000)}")
-        print(f"  • Coverage expansion: {(len(unique_to_fortune5000) / len(sp500_symbols) * 100):.1f}% more opportunities")
+        lines.append(f"\nOverlap Analysis:")
+        lines.append(f"  • Companies in both analyses: {overlap}")
+        lines.append(f"  • Additional opportunities in Fortune 5000: {unique_to_fortune5000}")
+        lines.append(f"  • Coverage expansion: {(unique_to_fortune5000 / len(sp500_summary.symbols) * 100):.1f}% more opportunities")
+    
+    sys.stdout.write('\n'.join(lines) + '\n')
 
-def analyze_sector_distribution(sp500_data, fortune5000_data):
+def analyze_sector_distribution(ctx):
     """Analyze sector distribution differences."""
     
-    print("\n" + "="*80)
-    print("SECTOR DISTRIBUTION ANALYSIS")
-    print("="*80)
+    lines = ["\n" + "="*80, "SECTOR DISTRIBUTION ANALYSIS", "="*80]
     
-    if sp500_data is not None and fortune5000_data is not None:
+    if ctx.compared:
         # Compare sector distributions
-        sp500_sectors = sp500_data['sector'].value_counts()
-        fortune5000_sectors = fortune5000_data['sector'].value_counts()
-        
-        # Create comparison DataFrame
-        comparison_df = pd.DataFrame({
-            'S&P 500': sp500_sectors,
-            'Fortune 5000': fortune5000_sectors
-        }).fillna(0)
-        
-        comparison_df['Difference'] = comparison_df['Fortune 5000'] - comparison_df['S&P 500']
-        comparison_df['% Increase'] = (comparison_df['Difference'] / comparison_df['S&P 500'] * 100).replace([float('inf'), -float('inf')], 0)
-        
-        print("Sector-wise comparison (companies with drops):")
-        print("-" * 60)
-        print(f"{'Sector':<25} {'S&P 500':<10} {'F5000':<10} {'Diff':<8} {'% Inc':<8}")
-        print("-" * 60)
-        
-        for sector in comparison_df.index:
-            sp500_count = int(comparison_df.loc[sector, 'S&P 500'])
-            f5000_count = int(comparison_df.loc[sector, 'Fortune 5000'])
-            diff = int(comparison_df.loc[sector, 'Difference'])
-            pct_inc = comparison_df.loc[sector, '% Increase']
-            
-            print(f"{sector[:24]:<25} {sp500_count:<10} {f5000_count:<10} {diff:<8} {pct_inc:>6.1f}%")
+        sp500_sectors = ctx.sp500.sector_counts
+        fortune5000_sectors = ctx.fortune5000.sector_counts
+        
+        # Align both distributions on the sorted union of sectors
+        sp500_aligned, fortune5000_aligned = sp500_sectors.align(fortune5000_sectors, join='outer', fill_value=0)
+        sp500_aligned = sp500_aligned.sort_index()
+        fortune5000_aligned = fortune5000_aligned.reindex(sp500_aligned.index)
+        
+        sp500_counts = sp500_aligned.to_numpy(dtype=np.int64)
+        fortune5000_counts = fortune5000_aligned.to_numpy(dtype=np.int64)
+        differences = fortune5000_counts - sp500_counts
+        
+        # Sectors absent from the S&P 500 results report a 0% increase
+        with np.errstate(divide='ignore', invalid='ignore'):
+            pct_increases = np.where(sp500_counts == 0, 0.0, differences / sp500_counts * 100.0)
+        
+        lines.append("Sector-wise comparison (companies with drops):")
+        lines.append("-" * 60)
+        lines.append(f"{'Sector':<25} {'S&P 500':<10} {'F5000':<10} {'Diff':<8} {'% Inc':<8}")
+        lines.append("-" * 60)
+        
+        # Bind the row format once instead of re-parsing an f-string per sector
+        row_format = "{:<25} {:<10} {:<10} {:<8} {:>6.1f}%".format
+        
+        for sector, sp500_count, f5000_count, diff, pct_inc in zip(
+                sp500_aligned.index, sp500_counts.tolist(), fortune5000_counts.tolist(),
+                differences.tolist(), pct_increases.tolist()):
+            lines.append(row_format(sector[:24], sp500_count, f5000_count, diff, pct_inc))
+    
+    sys.stdout.write('\n'.join(lines) + '\n')
+
+def categorize_market_caps(market_caps):
+    """Categorize companies by market cap in a single vectorized pass."""
+    values = market_caps.to_numpy(dtype=float)
+    codes = np.searchsorted(MARKET_CAP_THRESHOLDS, values, side='right').astype(np.int8)
+    # Missing market caps have always been reported as small caps
+    codes[np.isnan(values)] = 0
+    return pd.Categorical.from_codes(codes, categories=MARKET_CAP_LABELS)
 
-def analyze_market_cap_distribution(sp500_data, fortune5000_data):
+def analyze_market_cap_distribution(ctx):
     """Analyze market cap distribution differences."""
     
-    print("\n" + "="*80)
-    print("MARKET CAP DISTRIBUTION ANALYSIS")
-    print("="*80)
+    lines = ["\n" + "="*80, "MARKET CAP DISTRIBUTION ANALYSIS", "="*80]
     
-    def categorize_market_cap(market_cap):
-        """Categorize companies by market cap."""
-        if market_cap >= 200e9:  # $200B+
-            return "Mega Cap (>$200B)"
-        elif market_cap >= 10e9:  # $10B-$200B
-            return "Large Cap ($10B-$200B)"
-        elif market_cap >= 2e9:   # $2B-$10B
-            return "Mid Cap ($2B-$10B)"
-        else:                     # <$2B
-            return "Small Cap (<$2B)"
-    
-    if sp500_data is not None:
-        sp500_data['market_cap_category'] = sp500_data['market_cap'].apply(categorize_market_cap)
-        sp500_cap_dist = sp500_data['market_cap_category'].value_counts()
-        
-        print("S&P 500 Market Cap Distribution:")
-        for category, count in sp500_cap_dist.items():
-            print(f"  • {category}: {count} companies")
-    
-    if fortune5000_data is not None:
-        fortune5000_data['market_cap_category'] = fortune5000_data['market_cap'].apply(categorize_market_cap)
-        fortune5000_cap_dist = fortune5000_data['market_cap_category'].value_counts()
-        
-        print("\nFortune 5000 Market Cap Distribution:")
-        for category, count in fortune5000_cap_dist.items():
-            print(f"  • {category}: {count} companies")
-
-def show_top_opportunities(sp500_data, fortune5000_data):
+    if ctx.sp500 is not None:
+        lines.append("S&P 500 Market Cap Distribution:")
+        for category, count in ctx.sp500.cap_counts.items():
+            lines.append(f"  • {category}: {count} companies")
+    
+    if ctx.fortune5000 is not None:
+        lines.append("\nFortune 5000 Market Cap Distribution:")
+        for category, count in ctx.fortune5000.cap_counts.items():
+            lines.append(f"  • {category}: {count} companies")
+    
+    sys.stdout.write('\n'.join(lines) + '\n')
+
+def smallest_rows(data, column, k):
+    """
+    Return the k rows with the smallest values in a column, in ascending order.
+    
+    Uses np.partition so only the k selected rows are sorted. Matches
+    DataFrame.nsmallest: ties keep their original row order and NaNs only
+    fill the remaining slots.
+    """
+    values = data[column].to_numpy(dtype=float)
+    missing = np.isnan(values)
+    candidates = np.flatnonzero(~missing)
+    
+    if len(candidates) > k:
+        # Keep everything tied with the k-th value so ties resolve by row order
+        kth_value = np.partition(values[candidates], k - 1)[k - 1]
+        candidates = candidates[values[candidates] <= kth_value]
+    
+    order = candidates[np.argsort(values[candidates], kind='stable')][:k]
+    if len(order) < k:
+        order = np.concatenate([order, np.flatnonzero(missing)[:k - len(order)]])
+    return data.iloc[order]
+
+def show_top_opportunities(ctx):
     """Show top opportunities unique to Fortune 5000."""
     
-    print("\n" + "="*80)
-    print("TOP UNIQUE OPPORTUNITIES IN FORTUNE 5000")
-    print("="*80)
+    lines = ["\n" + "="*80, "TOP UNIQUE OPPORTUNITIES IN FORTUNE 5000", "="*80]
     
-    if sp500_data is not None and fortune5000_data is not None:
-        sp500_symbols = set(sp500_data['symbol'].tolist())
-        
-        # Find companies unique to Fortune 5000
-        unique_fortune5000 = fortune5000_data[~fortune5000_data['symbol'].isin(sp500_symbols)]
+    if ctx.compared:
+        # Find companies unique to Fortune 5000, copying only the displayed columns
+        unique_fortune5000 = ctx.fortune5000_data.loc[ctx.unique_to_fortune5000_mask, RESULT_COLUMNS]
         
         if len(unique_fortune5000) > 0:
-            # Sort by percentage change (most negative first)
-            top_unique = unique_fortune5000.nsmallest(10, 'percent_change')
+            # Most negative percentage changes first
+            top_unique = smallest_rows(unique_fortune5000, 'percent_change', 10)
+            
+            lines.append("Top 10 unique opportunities not in S&P 500:")
+            lines.append("-" * 100)
+            lines.append(f"{'Symbol':<8} {'Company':<35} {'Sector':<20} {'Change':<8} {'Mkt Cap':<12}")
+            lines.append("-" * 100)
+            
+            # Format all market caps up front rather than branching per row
+            market_caps = top_unique['market_cap'].to_numpy(dtype=float)
+            market_cap_strs = np.where(market_caps >= 1e9,
+                                       np.char.mod("$%.1fB", market_caps / 1e9),
+                                       np.char.mod("$%.0fM", market_caps / 1e6))
             
-            print("Top 10 unique opportunities not in S&P 500:")
-            print("-" * 100)
-            print(f"{'Symbol':<8} {'Company':<35} {'Sector':<20} {'Change':<8} {'Mkt Cap':<12}")
-            print("-" * 100)
+            rows = top_unique[['symbol', 'company_name', 'sector', 'percent_change']].itertuples(index=False, name=None)
             
-            for _, row in top_unique.iterrows():
-                market_cap_str = f"${row['market_cap']/1e9:.1f}B" if row['market_cap'] >= 1e9 else f"${row['market_cap']/1e6:.0f}M"
-                print(f"{row['symbol']:<8} {str(row['company_name'])[:34]:<35} {str(row['sector'])[:19]:<20} {row['percent_change']:>6.2f}% {market_cap_str:<12}")
+            for (symbol, company, sector, pct_change), market_cap_str in zip(rows, market_cap_strs):
+                lines.append(f"{symbol:<8} {str(company)[:34]:<35} {str(sector)[:19]:<20} {pct_change:>6.2f}% {market_cap_str:<12}")
         else:
-            print("No unique opportunities found (all Fortune 5000 drops are also in S&P 500)")
+            lines.append("No unique opportunities found (all Fortune 5000 drops are also in S&P 500)")
+    
+    sys.stdout.write('\n'.join(lines) + '\n')
 
 def generate_summary_report():
     """Generate a comprehensive summary report."""
@@ -189,37 +405,46 @@ def generate_summary_report():
         print("❌ No analysis results found. Please run the analysis scripts first.")
         return
     
+    # Aggregate each frame once and share the results between analyses
+    ctx = build_report_context(sp500_data, fortune5000_data)
+    sp500_summary, fortune5000_summary = ctx.sp500, ctx.fortune5000
+    
     # Perform all analyses
-    analyze_coverage_differences(sp500_data, fortune5000_data)
-    analyze_sector_distribution(sp500_data, fortune5000_data)
-    analyze_market_cap_distribution(sp500_data, fortune5000_data)
-    show_top_opportunities(sp500_data, fortune5000_data)
+    analyze_coverage_differences(ctx)
+    analyze_sector_distribution(ctx)
+    analyze_market_cap_distribution(ctx)
+    show_top_opportunities(ctx)
     
-    print("\n" + "="*80)
-    print("KEY INSIGHTS")
-    print("="*80)
+    lines = ["\n" + "="*80, "KEY INSIGHTS", "="*80]
     
-    if fortune5000_data is not None:
-        total_drops = len(fortune5000_data)
-        avg_drop = fortune5000_data['percent_change'].mean()
-        sectors_covered = fortune5000_data['sector'].nunique()
+    if fortune5000_summary is not None:
+        total_drops = fortune5000_summary.n
+        avg_drop = fortune5000_summary.pct_mean
+        sectors_covered = len(fortune5000_summary.sector_counts)
         
-        print(f"✅ Fortune 5000 analysis identified {total_drops} companies with significant drops")
-        print(f"✅ Average drop magnitude: {avg_drop:.2f}%")
-        print(f"✅ Sector diversity: {sectors_covered} different sectors represented")
+        lines.append(f"✅ Fortune 5000 analysis identified {total_drops} companies with significant drops")
+        lines.append(f"✅ Average drop magnitude: {avg_drop:.2f}%")
+        lines.append(f"✅ Sector diversity: {sectors_covered} different sectors represented")
         
-        # Market cap insights
-        large_cap_count = len(fortune5000_data[fortune5000_data['market_cap'] >= 10e9])
-        mid_cap_count = len(fortune5000_data[(fortune5000_data['market_cap'] >= 2e9) & (fortune5000_data['market_cap'] < 10e9)])
+        # Market cap insights (large-cap here includes mega caps)
+        cap_counts = fortune5000_summary.cap_counts
+        large_cap_count = cap_counts.get(MARKET_CAP_LABELS[2], 0) + cap_counts.get(MARKET_CAP_LABELS[3], 0)
+        mid_cap_count = cap_counts.get(MARKET_CAP_LABELS[1], 0)
         
-        print(f"✅ Market cap diversity: {large_cap_count} large-cap, {mid_cap_count} mid-cap opportunities")
+        lines.append(f"✅ Market cap diversity: {large_cap_count} large-cap, {mid_cap_count} mid-cap opportunities")
         
-        if sp500_data is not None:
-            expansion_rate = (len(fortune5000_data) - len(sp500_data)) / len(sp500_data) * 100
-            print(f"✅ {expansion_rate:.1f}% more opportunities compared to S&P 500 analysis")
+        if sp500_summary is not None:
+            expansion_rate = (fortune5000_summary.n - sp500_summary.n) / sp500_summary.n * 100
+            lines.append(f"✅ {expansion_rate:.1f}% more opportunities compared to S&P 500 analysis")
+    
+    lines.append("\n💡 The Fortune 5000 expansion provides significantly broader market coverage,")
+    lines.append("   identifying more opportunities across diverse sectors and market caps.")
     
-    print("\n💡 The Fortune 5000 expansion provides significantly broader market coverage,")
-    print("   identifying more opportunities across diverse sectors and market caps.")
+    sys.stdout.write('\n'.join(lines) + '\n')
 
 if __name__ == "__main__":
-    generate_summary_report()
\ No newline at end of file
+    if len(sys.argv) > 1 and sys.argv[1] == '--to-parquet':
+        for csv_path in sys.argv[2:]:
+            print(f"Converted {csv_path} -> {convert_results_to_parquet(csv_path)}")
+    else:
+        generate_summary_report()
\ No newline at end of file
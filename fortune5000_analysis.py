@@ -0,0 +1,1349 @@
+import pandas as pd
+import yfinance as yf
+from datetime import datetime, timedelta
+from dateutil.tz import tzlocal
+import time
+import logging
+from typing import List, Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+import warnings
+import numpy as np
+import csv
+import json
+import os
+import hashlib
+import random
+import re
+import threading
+from dataclasses import asdict, dataclass, fields
+from functools import lru_cache, wraps
+from operator import attrgetter
+from rate_limit_config import get_config, RATE_LIMIT_CONFIG
+
+try:
+    import pyarrow as pa
+except ImportError:  # pyarrow is optional; fall back to pandas' parser
+    pa = None
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    handlers=[
+        logging.FileHandler('fortune5000_analysis.log'),
+        logging.StreamHandler()
+    ]
+)
+logger = logging.getLogger(__name__)
+
+# Suppress pandas warnings for cleaner output
+warnings.filterwarnings('ignore', category=FutureWarning)
+
+def _ewm_mean(values: np.ndarray, alpha: float, min_periods: int) -> np.ndarray:
+    """
+    Recursive exponential moving average along axis 0, as pandas ewm(adjust=False).
+    Leading NaNs are skipped; rows before min_periods observations are NaN.
+    """
+    out = np.full(values.shape, np.nan)
+    mean = np.full(values.shape[1:], np.nan)
+    count = np.zeros(values.shape[1:], dtype=np.int64)
+    
+    for i, row in enumerate(values):
+        valid = ~np.isnan(row)
+        mean = np.where(np.isnan(mean), row, np.where(valid, (1 - alpha) * mean + alpha * row, mean))
+        count += valid
+        out[i] = np.where(count >= min_periods, mean, np.nan)
+    
+    return out
+
+def _rsi_last(close: np.ndarray, period: int = 14):
+    """Latest Wilder RSI, matching ta.momentum.RSIIndicator."""
+    diff = np.diff(close, axis=0, prepend=close[:1])
+    up = np.where(diff > 0, diff, 0.0)
+    down = np.where(diff < 0, -diff, 0.0)
+    
+    # Keep leading padding rows as missing so they do not count towards the window
+    padding = np.isnan(close)
+    up[padding] = np.nan
+    down[padding] = np.nan
+    
+    ema_up = _ewm_mean(up, 1 / period, period)[-1]
+    ema_down = _ewm_mean(down, 1 / period, period)[-1]
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(ema_down == 0, 100.0, 100 - 100 / (1 + ema_up / ema_down))[()]
+
+def _macd_last(close: np.ndarray, fast: int = 12, slow: int = 26, signal: int = 9):
+    """Latest MACD line, signal line and histogram, matching ta.trend.MACD."""
+    macd = _ewm_mean(close, 2 / (fast + 1), fast) - _ewm_mean(close, 2 / (slow + 1), slow)
+    macd_signal = _ewm_mean(macd, 2 / (signal + 1), signal)
+    return macd[-1], macd_signal[-1], macd[-1] - macd_signal[-1]
+
+def _obv_last(close: np.ndarray, volume: np.ndarray):
+    """Latest On-Balance Volume, matching ta.volume.OnBalanceVolumeIndicator."""
+    falling = np.zeros(close.shape, dtype=bool)
+    falling[1:] = close[1:] < close[:-1]
+    return np.where(falling, -volume, volume).sum(axis=0)
+
+@dataclass(slots=True)
+class StockResult:
+    """Analysis result for a stock that crossed the drop threshold; fields are the CSV columns in order."""
+    symbol: str
+    company_name: str
+    sector: str
+    current_price: float
+    previous_close: float
+    percent_change: float
+    market_cap: int
+    fifty_two_week_high: float
+    fifty_two_week_low: float
+    distance_from_high: float
+    volume: float
+    avg_volume: float
+    rsi: Optional[float] = None
+    macd: Optional[float] = None
+    macd_signal: Optional[float] = None
+    macd_histogram: Optional[float] = None
+    obv: Optional[int] = None
+    pe_ratio: Optional[float] = None
+    forward_pe: Optional[float] = None
+    peg_ratio: Optional[float] = None
+    debt_to_equity: Optional[float] = None
+    free_cash_flow: Optional[float] = None
+    dividend_yield: Optional[float] = None
+    book_value: Optional[float] = None
+    price_to_book: Optional[float] = None
+    return_on_equity: Optional[float] = None
+
+STOCK_RESULT_FIELDS = [field.name for field in fields(StockResult)]
+_stock_result_row = attrgetter(*STOCK_RESULT_FIELDS)
+
+@lru_cache(maxsize=8192)
+def _fundamental_ratios(pe_ratio, forward_pe, peg_ratio, total_debt, total_equity, free_cash_flow,
+                        dividend_yield, book_value, price_to_book, return_on_equity) -> Dict[str, float]:
+    """Derive the reported fundamental ratios from raw stock info values (cached by value)."""
+    # Debt-to-Equity Ratio
+    debt_to_equity = (total_debt / total_equity) if total_equity and total_equity != 0 else None
+    
+    # Dividend Yield
+    if dividend_yield:
+        dividend_yield = dividend_yield * 100  # Convert to percentage
+    
+    # Return on Equity
+    if return_on_equity:
+        return_on_equity = return_on_equity * 100  # Convert to percentage
+    
+    return {
+        'pe_ratio': round(pe_ratio, 2) if pe_ratio else None,
+        'forward_pe': round(forward_pe, 2) if forward_pe else None,
+        'peg_ratio': round(peg_ratio, 2) if peg_ratio else None,
+        'debt_to_equity': round(debt_to_equity, 2) if debt_to_equity else None,
+        'free_cash_flow': free_cash_flow,
+        'dividend_yield': round(dividend_yield, 2) if dividend_yield else None,
+        'book_value': round(book_value, 2) if book_value else None,
+        'price_to_book': round(price_to_book, 2) if price_to_book else None,
+        'return_on_equity': round(return_on_equity, 2) if return_on_equity else None
+    }
+
+@lru_cache(maxsize=4096)
+def _format_market_cap(market_cap: int) -> str:
+    """Format market cap in readable format (cached, values repeat across displays)."""
+    if market_cap >= 1e12:
+        return f"${market_cap/1e12:.2f}T"
+    elif market_cap >= 1e9:
+        return f"${market_cap/1e9:.2f}B"
+    elif market_cap >= 1e6:
+        return f"${market_cap/1e6:.2f}M"
+    else:
+        return f"${market_cap:,.0f}"
+
+# Market cap buckets for column formatting: below 1M, millions, billions, trillions
+_MARKET_CAP_THRESHOLDS = np.array([1e6, 1e9, 1e12])
+_MARKET_CAP_DIVISORS = np.array([1.0, 1e6, 1e9, 1e12])
+_MARKET_CAP_SUFFIXES = ('', 'M', 'B', 'T')
+
+def _format_market_caps(market_caps: List[float]) -> List[str]:
+    """Format a column of market caps, picking every unit with one searchsorted call."""
+    values = np.asarray(market_caps, dtype=np.float64)
+    buckets = np.searchsorted(_MARKET_CAP_THRESHOLDS, values, side='right')
+    scaled = values / _MARKET_CAP_DIVISORS[buckets]
+    
+    return [
+        f"${value:.2f}{_MARKET_CAP_SUFFIXES[bucket]}" if bucket else f"${value:,.0f}"
+        for value, bucket in zip(scaled.tolist(), buckets.tolist())
+    ]
+
+@lru_cache(maxsize=4096)
+def _format_large_number(number: float) -> str:
+    """Format large numbers (like FCF) in readable format (cached)."""
+    if number is None:
+        return "N/A"
+    
+    if abs(number) >= 1e12:
+        return f"${number/1e12:.2f}T"
+    elif abs(number) >= 1e9:
+        return f"${number/1e9:.2f}B"
+    elif abs(number) >= 1e6:
+        return f"${number/1e6:.2f}M"
+    elif abs(number) >= 1e3:
+        return f"${number/1e3:.2f}K"
+    else:
+        return f"${number:,.0f}"
+
+# Full-day NYSE closures; extend yearly (weekends are handled by the calendar itself)
+US_MARKET_HOLIDAYS = [
+    '2025-01-01', '2025-01-09', '2025-01-20', '2025-02-17', '2025-04-18', '2025-05-26',
+    '2025-06-19', '2025-07-04', '2025-09-01', '2025-11-27', '2025-12-25',
+    '2026-01-01', '2026-01-19', '2026-02-16', '2026-04-03', '2026-05-25',
+    '2026-06-19', '2026-07-03', '2026-09-07', '2026-11-26', '2026-12-25',
+    '2027-01-01', '2027-01-18', '2027-02-15', '2027-03-26', '2027-05-31',
+    '2027-06-18', '2027-07-05', '2027-09-06', '2027-11-25', '2027-12-24',
+]
+US_MARKET_CALENDAR = np.busdaycalendar(holidays=US_MARKET_HOLIDAYS)
+
+class TokenBucket:
+    """
+    Thread-safe token bucket shared by all workers. Requests go out immediately
+    while tokens remain and wait only once the bucket is empty, so the average
+    rate never exceeds `rate` requests per second.
+    """
+    
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.last_refill = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def acquire(self, n: int = 1) -> None:
+        """Take n tokens, sleeping until they are available."""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.last_refill) * self.rate)
+            self.last_refill = now
+            
+            # Going negative reserves a future token, so waiters are served in order
+            self.tokens -= n
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+            
+            # Up to a tenth of a token interval of jitter, so workers released together
+            # do not fire in lockstep
+            wait += random.uniform(0, 0.1 / self.rate)
+        
+        time.sleep(wait)
+
+class AdaptiveTokenBucket(TokenBucket):
+    """
+    Token bucket whose rate follows the observed rate-limit responses: every window
+    the rate is halved if too many requests were rejected with 429, and otherwise
+    grows back by a fixed step up to the preset rate.
+    """
+    
+    def __init__(self, rate: float, burst: int, window: float, max_error_rate: float, increase: float):
+        super().__init__(rate, burst)
+        self.max_rate = rate
+        self.min_rate = rate / 16
+        self.step = rate * increase
+        self.window = window
+        self.max_error_rate = max_error_rate
+        self.window_start = time.monotonic()
+        self.responses = 0
+        self.rate_limited = 0
+    
+    def record_response(self, rate_limited: bool) -> None:
+        """Count a response and adjust the rate once the current window has elapsed."""
+        with self.lock:
+            self.responses += 1
+            self.rate_limited += rate_limited
+            
+            now = time.monotonic()
+            if now - self.window_start < self.window:
+                return
+            
+            previous_rate = self.rate
+            if self.rate_limited / self.responses > self.max_error_rate:
+                self.rate = max(self.min_rate, self.rate / 2)
+            else:
+                self.rate = min(self.max_rate, self.rate + self.step)
+            
+            if self.rate != previous_rate:
+                logger.info("Rate limited on %d/%d requests, request rate %.2f -> %.2f/s",
+                            self.rate_limited, self.responses, previous_rate, self.rate)
+            
+            self.window_start = now
+            self.responses = 0
+            self.rate_limited = 0
+
+class Fortune5000Analyzer:
+    """
+    A comprehensive US stock analyzer that identifies significant price drops across
+    all US public companies and provides detailed analysis including historical data
+    and recent news. Uses comprehensive ticker data from us_public_tickers.csv.
+    """
+    
+    # Special characters and one-letter share class suffixes (preferred stocks, warrants, units, etc.)
+    EXCLUDED_TICKER_PATTERN = re.compile(r'[$#]|\.[A-Z]$')
+    
+    # A leading letter followed by letters, digits and hyphens (plus a trailing dot left as-is)
+    VALID_TICKER_PATTERN = re.compile(r'[A-Za-z][A-Za-z0-9.\-]*')
+    
+    # Daily closes change at most once per session, so reruns within this window reuse downloads
+    HISTORY_CACHE_TTL = timedelta(hours=4)
+    
+    # Company info (names, sectors, 52-week range) drifts daily; news turns over within hours
+    INFO_CACHE_TTL = timedelta(days=1)
+    NEWS_CACHE_TTL = timedelta(hours=1)
+    
+    # Progress checkpoints are only resumed on the day they were written
+    PROGRESS_CACHE_TTL = timedelta(days=1)
+    
+    def __init__(self, drop_threshold: float = -10.0, rate_limit_preset: str = 'balanced',
+                 history_cache_dir: Optional[str] = 'yf_cache'):
+        """
+        Initialize the analyzer with configurable parameters.
+        
+        Args:
+            drop_threshold: Minimum percentage drop to flag (default: -10%)
+            rate_limit_preset: Rate limiting preset ('aggressive', 'balanced', 'conservative', 'ultra_conservative')
+            history_cache_dir: Directory for cached downloads, info, news and progress checkpoints,
+                or None to disable caching
+        """
+        self.drop_threshold = drop_threshold
+        self.history_cache_dir = history_cache_dir
+        
+        # Load rate limiting configuration
+        config = get_config(rate_limit_preset)
+        self.max_workers = config['max_workers']
+        self.batch_size = config['batch_size']
+        self.inter_batch_delay = config['inter_batch_delay']
+        self.requests_per_second = config['requests_per_second']
+        self.burst = config['burst']
+        self.backoff_cap = config['backoff_cap']
+        
+        # Rate limiting state
+        self.request_count = 0
+        self.token_bucket = AdaptiveTokenBucket(
+            self.requests_per_second, self.burst,
+            window=RATE_LIMIT_CONFIG['adaptive_window'],
+            max_error_rate=RATE_LIMIT_CONFIG['adaptive_max_error_rate'],
+            increase=RATE_LIMIT_CONFIG['adaptive_increase']
+        )
+        self.rate_limit_lock = threading.Lock()
+        self.failed_requests = []
+        self.cold_tickers = []  # Retries exhausted; given one more pass at the end of the run
+        self.tickers = {}  # yf.Ticker per symbol being analyzed, shared by its history and info calls
+        self.rate_limit_preset = rate_limit_preset
+        
+        # Tickers finished today, checkpointed after every batch so an interrupted run can resume
+        self.completed_tickers = set()
+        
+        # Results CSV, opened on the first drop and appended to after every batch
+        self.results_filename = None
+        self.results_file = None
+        self.results_writer = None
+        
+        logger.info("Initialized with '%s' rate limiting preset", rate_limit_preset)
+        logger.info("Config: %d workers, batch size %d, %s requests/s (burst %d)",
+                    self.max_workers, self.batch_size, self.requests_per_second, self.burst)
+        
+    def get_fortune5000_tickers(self) -> Optional[List[str]]:
+        """
+        Load all US public company tickers from the us_public_tickers.csv file.
+        This provides comprehensive coverage of all US listed stocks.
+        
+        Returns:
+            List of ticker symbols or None if failed
+        """
+        try:
+            logger.info("Loading US public company tickers from us_public_tickers.csv...")
+            
+            # Read only the Symbol column, with the multithreaded Arrow parser when available
+            df = pd.read_csv(
+                'us_public_tickers.csv',
+                usecols=['Symbol'],
+                dtype={'Symbol': 'string'},
+                engine='pyarrow' if pa is not None else 'c'
+            )
+            
+            # Get the ticker symbols from the 'Symbol' column
+            all_tickers = df['Symbol'].dropna().astype(str).str.strip()
+            
+            # Skip empty or invalid tickers, special suffixes (preferred stocks,
+            # warrants, etc.) and tickers with special characters
+            lengths = all_tickers.str.len()
+            keep = (
+                (lengths > 0) & (lengths <= 6) & (all_tickers != 'nan') &
+                ~all_tickers.str.contains(self.EXCLUDED_TICKER_PATTERN)
+            )
+            tickers = all_tickers[keep]
+            
+            # Handle special cases like BRK.A -> BRK-A
+            has_dot = tickers.str.contains('.', regex=False) & ~tickers.str.endswith('.')
+            tickers = tickers.where(~has_dot, tickers.str.replace('.', '-', regex=False))
+            
+            # Only include tickers with letters (and possibly numbers and hyphens)
+            tickers = tickers[tickers.str.fullmatch(self.VALID_TICKER_PATTERN)]
+            
+            # Remove duplicates and sort
+            valid_tickers = tickers.drop_duplicates().sort_values().tolist()
+            
+            logger.info("Loaded %d total tickers from CSV", len(all_tickers))
+            logger.info("Filtered to %d valid common stock tickers", len(valid_tickers))
+            
+            return valid_tickers
+            
+        except FileNotFoundError:
+            logger.error("us_public_tickers.csv file not found!")
+            logger.error("Please ensure the file is in the current directory.")
+            return None
+        except Exception as e:
+            logger.error("Error loading tickers from CSV: %s", e)
+            return None
+
+
+    def get_last_trading_day(self) -> datetime:
+        """
+        Get the last trading day before today (excludes weekends and NYSE holidays).
+        
+        Returns:
+            Last trading day as datetime object, at the current time of day
+        """
+        today = datetime.now()
+        
+        # Weekends roll forward to Monday first, so Saturday to Monday all step back to Friday
+        last_trading_day = np.busday_offset(
+            np.datetime64(today.date()), -1, roll='forward', busdaycal=US_MARKET_CALENDAR
+        ).astype(datetime)
+        
+        return datetime.combine(last_trading_day, today.time())
+
+    def calculate_technical_indicators(self, hist_data: pd.DataFrame) -> Dict[str, float]:
+        """
+        Calculate technical indicators (RSI, MACD, OBV) from historical data.
+        
+        Args:
+            hist_data: Historical price data from yfinance
+            
+        Returns:
+            Dictionary containing technical indicator values
+        """
+        try:
+            if len(hist_data) < 14:  # Need at least 14 days for RSI
+                return {
+                    'rsi': None,
+                    'macd': None,
+                    'macd_signal': None,
+                    'macd_histogram': None,
+                    'obv': None
+                }
+            
+            close = hist_data['Close'].to_numpy(dtype=np.float64)
+            volume = hist_data['Volume'].fillna(0).to_numpy(dtype=np.int64)
+            
+            # Calculate RSI (14-day period)
+            rsi = _rsi_last(close, period=14)
+            
+            # Calculate MACD
+            macd, macd_signal, macd_histogram = _macd_last(close)
+            
+            # Calculate OBV (On-Balance Volume)
+            obv = _obv_last(close, volume)
+            
+            return self.round_technical_indicators(rsi, macd, macd_signal, macd_histogram, obv)[0]
+            
+        except Exception as e:
+            logger.warning("Error calculating technical indicators: %s", e)
+            return {
+                'rsi': None,
+                'macd': None,
+                'macd_signal': None,
+                'macd_histogram': None,
+                'obv': None
+            }
+
+    def calculate_batch_technical_indicators(self, histories: Dict[str, pd.DataFrame]) -> Dict[str, Dict[str, float]]:
+        """
+        Calculate technical indicators for a whole batch at once.
+        
+        Histories are right-aligned into (days, tickers) Close and Volume matrices
+        (NaN-padded float64 prices, zero-padded int64 volumes), so every indicator
+        runs as one vectorized pass over all tickers.
+        
+        Args:
+            histories: Historical price data per ticker from download_batch_history
+            
+        Returns:
+            Dictionary mapping ticker symbol to its technical indicator values
+        """
+        try:
+            # Need at least 14 days for RSI
+            symbols = [symbol for symbol, hist in histories.items() if len(hist) >= 14]
+            if not symbols:
+                return {}
+            
+            days = max(len(histories[symbol]) for symbol in symbols)
+            close = np.full((days, len(symbols)), np.nan)
+            volume = np.zeros((days, len(symbols)), dtype=np.int64)
+            
+            for column, symbol in enumerate(symbols):
+                hist = histories[symbol]
+                close[days - len(hist):, column] = hist['Close'].to_numpy(dtype=np.float64)
+                volume[days - len(hist):, column] = hist['Volume'].fillna(0).to_numpy(dtype=np.int64)
+            
+            rsi = _rsi_last(close, period=14)
+            macd, macd_signal, macd_histogram = _macd_last(close)
+            obv = _obv_last(close, volume)
+            
+            return dict(zip(symbols, self.round_technical_indicators(rsi, macd, macd_signal, macd_histogram, obv)))
+            
+        except Exception as e:
+            logger.warning("Error calculating batch technical indicators: %s", e)
+            return {}
+
+    def find_batch_drops(self, histories: Dict[str, pd.DataFrame]) -> set:
+        """
+        Find the tickers whose latest close crossed the drop threshold, in one vectorized pass.
+        
+        Args:
+            histories: Historical price data per ticker from download_batch_history
+            
+        Returns:
+            Set of dropped tickers, plus tickers with fewer than two closes so
+            analyze_single_stock can report them
+        """
+        short = {symbol for symbol, hist in histories.items() if len(hist) < 2}
+        symbols = [symbol for symbol in histories if symbol not in short]
+        if not symbols:
+            return short
+        
+        # (tickers, 2) matrix of the previous and current close
+        closes = np.array([histories[symbol]['Close'].to_numpy(dtype=np.float64)[-2:] for symbol in symbols])
+        with np.errstate(divide='ignore', invalid='ignore'):
+            percent_change = (closes[:, 1] - closes[:, 0]) / closes[:, 0] * 100
+        
+        return short.union(np.array(symbols, dtype=object)[percent_change <= self.drop_threshold])
+
+    def round_technical_indicators(self, rsi, macd, macd_signal, macd_histogram, obv) -> List[Dict[str, float]]:
+        """
+        Round raw indicator arrays for reporting, mapping missing values to None.
+        
+        NaNs are found with one np.isnan pass per indicator and the values are
+        unboxed with tolist(), so no per-value pandas scalar checks are needed.
+        
+        Returns:
+            One dictionary of indicator values per ticker column
+        """
+        def rounded(values, digits):
+            values = np.asarray(values, dtype=np.float64)
+            return [None if missing else round(value, digits)
+                    for value, missing in zip(values.tolist(), np.isnan(values).tolist())]
+        
+        # OBV is an integer sum and is never missing
+        obv_values = [int(value) for value in np.atleast_1d(obv).tolist()]
+        
+        return [
+            {'rsi': r, 'macd': m, 'macd_signal': s, 'macd_histogram': h, 'obv': o}
+            for r, m, s, h, o in zip(
+                rounded(np.atleast_1d(rsi), 2),
+                rounded(np.atleast_1d(macd), 4),
+                rounded(np.atleast_1d(macd_signal), 4),
+                rounded(np.atleast_1d(macd_histogram), 4),
+                obv_values
+            )
+        ]
+
+    def calculate_fundamental_ratios(self, info: Dict[str, Any]) -> Dict[str, float]:
+        """
+        Calculate fundamental financial ratios from stock info.
+        
+        Args:
+            info: Stock info dictionary from yfinance
+            
+        Returns:
+            Dictionary containing fundamental ratios
+        """
+        try:
+            # P/E, PEG, debt/equity inputs, free cash flow, dividend yield and book metrics
+            args = (
+                info.get('trailingPE', None),
+                info.get('forwardPE', None),
+                info.get('pegRatio', None),
+                info.get('totalDebt', 0),
+                info.get('totalStockholderEquity', 0),
+                info.get('freeCashflow', None),
+                info.get('dividendYield', None),
+                info.get('bookValue', None),
+                info.get('priceToBook', None),
+                info.get('returnOnEquity', None)
+            )
+            
+            try:
+                return dict(_fundamental_ratios(*args))
+            except TypeError:  # Unhashable info value; compute without the cache
+                return dict(_fundamental_ratios.__wrapped__(*args))
+            
+        except Exception as e:
+            logger.warning("Error calculating fundamental ratios: %s", e)
+            return {
+                'pe_ratio': None,
+                'forward_pe': None,
+                'peg_ratio': None,
+                'debt_to_equity': None,
+                'free_cash_flow': None,
+                'dividend_yield': None,
+                'book_value': None,
+                'price_to_book': None,
+                'return_on_equity': None
+            }
+
+    def rate_limited_request(self, func, cost=None):
+        """
+        Decorator to add rate limiting to API requests with exponential backoff.
+        Enhanced to handle 401 errors and other HTTP errors. Backoff uses decorrelated
+        jitter so workers that hit a rate limit together do not retry in lockstep.
+        
+        Args:
+            func: Function making the API request(s)
+            cost: Optional callable giving the number of requests a call makes from its
+                arguments; each call counts as one request by default
+        """
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            max_retries = RATE_LIMIT_CONFIG['max_retries']
+            base_delay = RATE_LIMIT_CONFIG['exponential_backoff_base']
+            delay = base_delay
+            
+            for attempt in range(max_retries):
+                try:
+                    # Implement rate limiting with the token bucket shared by all workers
+                    requests_made = cost(*args, **kwargs) if cost else 1
+                    self.token_bucket.acquire(requests_made)
+                    
+                    with self.rate_limit_lock:
+                        self.request_count += requests_made
+                        request_count = self.request_count
+                    
+                    # Log progress every 50 requests
+                    if request_count // 50 > (request_count - requests_made) // 50:
+                        logger.info("Made %d API requests...", request_count)
+                    
+                    result = func(*args, **kwargs)
+                    self.token_bucket.record_response(rate_limited=False)
+                    return result
+                    
+                except Exception as e:
+                    error_str = str(e).lower()
+                    
+                    # Handle various types of errors that warrant retry
+                    if any(error_code in str(e) for error_code in ["401", "429", "500", "502", "503", "504"]) or \
+                       any(keyword in error_str for keyword in ["rate limit", "too many requests", "unauthorized", "server error", "timeout"]):
+                        
+                        # Calculate decorrelated-jitter backoff delay
+                        delay = min(self.backoff_cap, random.uniform(base_delay, delay * 3))
+                        
+                        if "401" in str(e) or "unauthorized" in error_str:
+                            logger.warning("HTTP 401 error on attempt %d, waiting %.2fs before retry", attempt + 1, delay)
+                        elif "429" in str(e) or "rate limit" in error_str or "too many requests" in error_str:
+                            logger.warning("Rate limited on attempt %d, waiting %.2fs", attempt + 1, delay)
+                            self.token_bucket.record_response(rate_limited=True)
+                        else:
+                            logger.warning("HTTP error %s on attempt %d, waiting %.2fs", e, attempt + 1, delay)
+                        
+                        time.sleep(delay)
+                        continue
+                    else:
+                        # Other error - don't retry
+                        logger.error("Non-retryable error: %s", e)
+                        raise e
+            
+            # All retries failed
+            logger.error("Failed after %d attempts", max_retries)
+            return None
+            
+        return wrapper
+
+    def download_batch_history(self, ticker_batch: List[str], period: str = "30d") -> Optional[Dict[str, pd.DataFrame]]:
+        """
+        Download price history for a whole batch with one yf.download call.
+        
+        yf.download still fetches each symbol separately on its own thread pool and
+        swallows per-symbol failures (including rate limiting), leaving an all-NaN
+        frame for them. Those symbols are left out of the result so callers fall
+        back to the rate-limited per-ticker fetch, which retries and reports them.
+        
+        Args:
+            ticker_batch: List of ticker symbols to download
+            period: yfinance period to download (30 days covers the indicators)
+            
+        Returns:
+            Dictionary mapping each ticker with data to its history, or None if the download failed
+        """
+        def fetch_batch_history(symbols):
+            return yf.download(
+                tickers=" ".join(symbols),
+                period=period,
+                group_by='ticker',
+                auto_adjust=True,  # Same adjusted closes as Ticker.history
+                threads=self.max_workers,  # Bound yfinance's download pool by the preset
+                progress=False
+            )
+        
+        # yf.download sends one request per symbol, so charge the bucket for each
+        fetch_batch_history = self.rate_limited_request(fetch_batch_history, cost=len)
+        
+        cache_path = None
+        if self.history_cache_dir:
+            batch_key = hashlib.sha1(f"{period} {' '.join(ticker_batch)}".encode()).hexdigest()[:16]
+            cache_path = os.path.join(self.history_cache_dir, f"history_{batch_key}.pkl")
+        
+        try:
+            if cache_path and os.path.exists(cache_path) and \
+               time.time() - os.path.getmtime(cache_path) < self.HISTORY_CACHE_TTL.total_seconds():
+                data = pd.read_pickle(cache_path)
+            else:
+                data = fetch_batch_history(ticker_batch)
+                
+                if cache_path and data is not None and not data.empty:
+                    os.makedirs(self.history_cache_dir, exist_ok=True)
+                    data.to_pickle(cache_path)
+        except Exception as e:
+            logger.error("Error downloading batch history: %s", e)
+            return None
+        
+        if data is None or data.empty:
+            return None
+        
+        # Symbols are aligned on a shared date index; drop the dates a symbol did not trade
+        if isinstance(data.columns, pd.MultiIndex):
+            returned = set(data.columns.get_level_values(0))
+            histories = {
+                symbol: data[symbol].dropna(subset=['Close'])
+                for symbol in ticker_batch
+                if symbol in returned
+            }
+        elif len(ticker_batch) == 1:
+            histories = {ticker_batch[0]: data.dropna(subset=['Close'])}
+        else:
+            return None
+        
+        # All-NaN symbols failed inside yf.download; leave them to the per-ticker fetch
+        return {symbol: hist for symbol, hist in histories.items() if not hist.empty}
+
+    def ticker_fetch(self, symbol: str, fetch):
+        """
+        Call fetch on the shared yf.Ticker for a symbol, discarding the object if the call fails.
+        
+        yfinance marks .info as fetched before requesting it, so after a failed call the
+        same object keeps returning None; retries must start from a fresh yf.Ticker.
+        
+        Args:
+            symbol: Ticker symbol
+            fetch: Function taking the yf.Ticker and making the API call
+            
+        Returns:
+            Whatever fetch returns
+        """
+        # No session= here: yfinance already pools connections through its process-wide
+        # curl_cffi session, and passing one would replace that session for every caller
+        ticker = self.tickers.get(symbol)
+        if ticker is None:
+            ticker = self.tickers.setdefault(symbol, yf.Ticker(symbol))
+        
+        try:
+            return fetch(ticker)
+        except Exception:
+            self.tickers.pop(symbol, None)
+            raise
+
+    def cached_fetch(self, kind: str, symbol: str, ttl: timedelta, fetch):
+        """
+        Fetch per-ticker JSON data through a file cache in the history cache directory.
+        
+        Args:
+            kind: Cache subdirectory ('info', 'news')
+            symbol: Ticker symbol, used as the file name
+            ttl: How long a cached entry stays fresh
+            fetch: Rate-limited fetch function called on a miss
+            
+        Returns:
+            The cached or freshly fetched data, or None if the fetch failed
+        """
+        path = os.path.join(self.history_cache_dir, kind, f"{symbol}.json") if self.history_cache_dir else None
+        
+        if path and os.path.exists(path) and time.time() - os.path.getmtime(path) < ttl.total_seconds():
+            try:
+                with open(path, encoding='utf-8') as f:
+                    return json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning("Ignoring unreadable cache file %s: %s", path, e)
+        
+        data = fetch(symbol)
+        
+        if path and data:
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with open(path + '.tmp', 'w', encoding='utf-8') as f:
+                    json.dump(data, f, default=str)
+                os.replace(path + '.tmp', path)
+            except (OSError, TypeError, ValueError) as e:
+                logger.warning("Error caching %s for %s: %s", kind, symbol, e)
+        
+        return data
+
+    def progress_path(self) -> Optional[str]:
+        """Path of today's progress checkpoint, keyed on date and drop threshold."""
+        if not self.history_cache_dir:
+            return None
+        return os.path.join(
+            self.history_cache_dir,
+            f"progress_{datetime.now().strftime('%Y%m%d')}_{self.drop_threshold:g}.json"
+        )
+
+    def prune_cache(self) -> None:
+        """Delete cached downloads, info, news and checkpoints older than their TTL."""
+        if not self.history_cache_dir or not os.path.isdir(self.history_cache_dir):
+            return
+        
+        ttls = [
+            (self.history_cache_dir, 'history_', self.HISTORY_CACHE_TTL),
+            (self.history_cache_dir, 'progress_', self.PROGRESS_CACHE_TTL),
+            (os.path.join(self.history_cache_dir, 'info'), '', self.INFO_CACHE_TTL),
+            (os.path.join(self.history_cache_dir, 'news'), '', self.NEWS_CACHE_TTL),
+        ]
+        
+        now = time.time()
+        removed = 0
+        for directory, prefix, ttl in ttls:
+            if not os.path.isdir(directory):
+                continue
+            for entry in os.scandir(directory):
+                try:
+                    if entry.is_file() and entry.name.startswith(prefix) and \
+                       now - entry.stat().st_mtime >= ttl.total_seconds():
+                        os.remove(entry.path)
+                        removed += 1
+                except OSError as e:
+                    logger.warning("Error pruning cache file %s: %s", entry.path, e)
+        
+        if removed:
+            logger.info("Pruned %d expired cache files from %s", removed, self.history_cache_dir)
+
+    def load_progress(self) -> List[StockResult]:
+        """
+        Restore today's checkpoint from an earlier, interrupted run.
+        
+        Returns:
+            Drops found by the earlier run; their tickers are added to completed_tickers
+        """
+        path = self.progress_path()
+        if not path or not os.path.exists(path):
+            return []
+        
+        try:
+            with open(path, encoding='utf-8') as f:
+                progress = json.load(f)
+            self.completed_tickers = set(progress['completed'])
+            return [StockResult(**result) for result in progress['results']]
+        except Exception as e:
+            logger.warning("Ignoring unreadable progress file %s: %s", path, e)
+            self.completed_tickers = set()
+            return []
+
+    def save_progress(self, dropped_stocks: List[StockResult]) -> None:
+        """Checkpoint completed tickers and drops found so far."""
+        path = self.progress_path()
+        if not path:
+            return
+        
+        try:
+            os.makedirs(self.history_cache_dir, exist_ok=True)
+            progress = {
+                'completed': sorted(self.completed_tickers),
+                'results': [asdict(result) for result in dropped_stocks]
+            }
+            # Write then rename so an interrupt never leaves a truncated checkpoint
+            with open(path + '.tmp', 'w', encoding='utf-8') as f:
+                json.dump(progress, f, default=lambda value: value.item())  # numpy scalars
+            os.replace(path + '.tmp', path)
+        except Exception as e:
+            logger.error("Error saving progress: %s", e)
+
+    def mark_completed(self, ticker_batch: List[str]) -> None:
+        """Record tickers that were analyzed, leaving cold and failed tickers for a later run."""
+        pending = set(self.cold_tickers).union(self.failed_requests)
+        self.completed_tickers.update(ticker for ticker in ticker_batch if ticker not in pending)
+
+    def analyze_single_stock(self, ticker_symbol: str, hist: Optional[pd.DataFrame] = None,
+                             technical_indicators: Optional[Dict[str, float]] = None) -> Optional[StockResult]:
+        """
+        Analyze a single stock for significant price drops with rate limiting.
+        
+        Args:
+            ticker_symbol: Stock ticker symbol
+            hist: Price history from a batch download; fetched per ticker if omitted
+            technical_indicators: Precomputed batch indicators; calculated from hist if omitted
+            
+        Returns:
+            StockResult with analysis results or None if no significant drop
+        """
+        @self.rate_limited_request
+        def fetch_stock_data(symbol):
+            # Get more historical data for technical indicators (30 days)
+            return self.ticker_fetch(symbol, lambda ticker: ticker.history(period="30d"))
+        
+        @self.rate_limited_request
+        def fetch_info(symbol):
+            return self.ticker_fetch(symbol, attrgetter('info'))
+        
+        try:
+            if hist is None or hist.empty:
+                hist = fetch_stock_data(ticker_symbol)
+                if hist is None:
+                    self.cold_tickers.append(ticker_symbol)
+                    return None
+            
+            if hist.empty or len(hist) < 2:
+                logger.warning("Insufficient data for %s", ticker_symbol)
+                return None
+            
+            # Get the two most recent trading days
+            previous_close = hist['Close'].iloc[-2]
+            current_close = hist['Close'].iloc[-1]
+            
+            # Calculate percentage change
+            percent_change = ((current_close - previous_close) / previous_close) * 100
+            
+            if percent_change <= self.drop_threshold:
+                # Stock info is a separate API call, so only drops pay for it
+                info = self.cached_fetch('info', ticker_symbol, self.INFO_CACHE_TTL, fetch_info)
+                if info is None:
+                    self.cold_tickers.append(ticker_symbol)
+                    return None
+                
+                company_name = info.get('longName', ticker_symbol)
+                sector = info.get('sector', 'Unknown')
+                market_cap = info.get('marketCap', 0)
+                
+                # Get 52-week high/low for context
+                fifty_two_week_high = info.get('fiftyTwoWeekHigh', 0)
+                fifty_two_week_low = info.get('fiftyTwoWeekLow', 0)
+                
+                # Calculate distance from 52-week high
+                distance_from_high = ((current_close - fifty_two_week_high) / fifty_two_week_high) * 100 if fifty_two_week_high else 0
+                
+                # Calculate technical indicators
+                if technical_indicators is None:
+                    technical_indicators = self.calculate_technical_indicators(hist)
+                
+                # Calculate fundamental ratios
+                fundamental_ratios = self.calculate_fundamental_ratios(info)
+                
+                # Combine all data
+                # Combine price data, technical indicators and fundamental ratios
+                return StockResult(
+                    symbol=ticker_symbol,
+                    company_name=company_name,
+                    sector=sector,
+                    current_price=current_close,
+                    previous_close=previous_close,
+                    percent_change=percent_change,
+                    market_cap=market_cap,
+                    fifty_two_week_high=fifty_two_week_high,
+                    fifty_two_week_low=fifty_two_week_low,
+                    distance_from_high=distance_from_high,
+                    volume=hist['Volume'].iloc[-1],
+                    avg_volume=hist['Volume'].mean(),
+                    **technical_indicators,
+                    **fundamental_ratios
+                )
+                
+        except Exception as e:
+            logger.error("Error analyzing %s: %s", ticker_symbol, e)
+            self.failed_requests.append(ticker_symbol)
+            return None
+        
+        finally:
+            # Later passes (cold retries, reruns in this process) fetch afresh
+            self.tickers.pop(ticker_symbol, None)
+
+    def get_stock_news(self, ticker_symbol: str, max_news: int = 3) -> List[Dict[str, str]]:
+        """
+        Get recent news for a stock ticker with rate limiting.
+        
+        Args:
+            ticker_symbol: Stock ticker symbol
+            max_news: Maximum number of news items to return
+            
+        Returns:
+            List of news items with title and link
+        """
+        @self.rate_limited_request
+        def fetch_news(symbol):
+            return self.ticker_fetch(symbol, attrgetter('news'))
+        
+        try:
+            news = self.cached_fetch('news', ticker_symbol, self.NEWS_CACHE_TTL, fetch_news)
+            
+            if news:
+                items = news[:max_news]
+                
+                # Convert all publish times in one pass; missing times become NaT
+                published_times = pd.to_datetime(
+                    [item.get('providerPublishTime') or None for item in items], unit='s', utc=True
+                ).tz_convert(tzlocal()).strftime('%Y-%m-%d %H:%M')
+                
+                return [
+                    {
+                        'title': item.get('title', 'No title'),
+                        'link': item.get('link', ''),
+                        'publisher': item.get('publisher', 'Unknown'),
+                        'published': published if isinstance(published, str) else 'Unknown'
+                    }
+                    for item, published in zip(items, published_times)
+                ]
+            return []
+            
+        except Exception as e:
+            logger.error("Error fetching news for %s: %s", ticker_symbol, e)
+            return []
+        
+        finally:
+            self.tickers.pop(ticker_symbol, None)
+
+    def format_market_cap(self, market_cap: int) -> str:
+        """Format market cap in readable format."""
+        return _format_market_cap(market_cap)
+
+    def format_large_number(self, number: float) -> str:
+        """Format large numbers (like FCF) in readable format."""
+        return _format_large_number(number)
+
+    def process_batch(self, ticker_batch: List[str]) -> List[StockResult]:
+        """
+        Process a batch of tickers with controlled concurrency.
+        
+        Args:
+            ticker_batch: List of ticker symbols to process
+            
+        Returns:
+            List of analysis results
+        """
+        if not ticker_batch:
+            return []
+        
+        # A few days of closes for the whole batch is enough to find the drops
+        recent = self.download_batch_history(ticker_batch, period="5d") or {}
+        drops = self.find_batch_drops(recent)
+        
+        # Only drops (and tickers the download could not answer) need further work
+        ticker_batch = [ticker for ticker in ticker_batch if ticker in drops or ticker not in recent]
+        
+        # Full history for the indicators, for the drops only; misses fall back to per-ticker history
+        dropped = [ticker for ticker in ticker_batch if ticker in drops]
+        histories = (self.download_batch_history(dropped) or {}) if dropped else {}
+        indicators = self.calculate_batch_technical_indicators(histories)
+        
+        # One job per worker rather than per ticker to keep per-submit overhead down
+        jobs = [(ticker, histories.get(ticker), indicators.get(ticker)) for ticker in ticker_batch]
+        chunk_size = max(1, -(-len(jobs) // self.max_workers))
+        chunks = [jobs[i:i + chunk_size] for i in range(0, len(jobs), chunk_size)]
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            batch_results = [
+                result
+                for chunk_results in executor.map(self.analyze_ticker_chunk, chunks)
+                for result in chunk_results
+            ]
+        
+        return batch_results
+
+    def analyze_ticker_chunk(self, jobs: List[tuple]) -> List[StockResult]:
+        """Analyze (ticker, history, indicators) jobs in order, keeping only the drops."""
+        # analyze_single_stock logs and swallows its own errors, returning None on failure
+        results = (self.analyze_single_stock(*job) for job in jobs)
+        return [result for result in results if result]
+
+    def analyze_us_stocks(self) -> None:
+        """
+        Main analysis function that processes all US public stocks with improved rate limiting.
+        """
+        logger.info("Starting comprehensive US stock analysis with rate limiting...")
+        self.tickers.clear()
+        
+        tickers = self.get_fortune5000_tickers()
+        if not tickers:
+            logger.error("Failed to retrieve ticker list. Exiting.")
+            return
+
+        print("\n" + "="*80)
+        print("COMPREHENSIVE US STOCK ANALYSIS (Rate Limited)")
+        print(f"Threshold: {self.drop_threshold}% or lower")
+        print(f"Analysis Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        print(f"Analyzing {len(tickers)} US public companies")
+        print(f"Batch size: {self.batch_size}, Max workers: {self.max_workers}")
+        print(f"Rate limit: {self.requests_per_second} requests/s (burst {self.burst})")
+        print("="*80)
+
+        # Pick up where an interrupted run left off today
+        self.prune_cache()
+        dropped_stocks = self.load_progress()
+        if self.completed_tickers:
+            tickers = [ticker for ticker in tickers if ticker not in self.completed_tickers]
+            logger.info("Resuming: %d tickers already analyzed today, %d remaining",
+                        len(self.completed_tickers), len(tickers))
+            self.write_results_to_csv(dropped_stocks)
+        processed_count = 0
+        
+        # Process tickers in batches to avoid overwhelming the API
+        total_batches = (len(tickers) + self.batch_size - 1) // self.batch_size
+        
+        for batch_num in range(0, len(tickers), self.batch_size):
+            batch_tickers = tickers[batch_num:batch_num + self.batch_size]
+            current_batch = (batch_num // self.batch_size) + 1
+            
+            logger.info("Processing batch %d/%d (%d tickers)", current_batch, total_batches, len(batch_tickers))
+            
+            # Process the batch
+            batch_results = self.process_batch(batch_tickers)
+            dropped_stocks.extend(batch_results)
+            
+            # Persist drops as they are found so an interrupted run keeps partial results
+            self.write_results_to_csv(batch_results)
+            self.mark_completed(batch_tickers)
+            self.save_progress(dropped_stocks)
+            
+            processed_count += len(batch_tickers)
+            
+            # Progress update
+            logger.info("Batch %d complete. Processed %d/%d stocks. Found %d drops in this batch.", current_batch, processed_count, len(tickers), len(batch_results))
+            
+            # Inter-batch delay to be respectful to the API
+            if current_batch < total_batches:  # Don't sleep after the last batch
+                inter_batch_delay = random.uniform(*self.inter_batch_delay)
+                logger.info("Waiting %.1fs before next batch...", inter_batch_delay)
+                time.sleep(inter_batch_delay)
+
+        # Give tickers that exhausted their retries one more pass after a cool-down
+        if self.cold_tickers:
+            cold_tickers, self.cold_tickers = self.cold_tickers, []
+            inter_batch_delay = random.uniform(*self.inter_batch_delay)
+            logger.info("Retrying %d tickers that exhausted their retries in %.1fs...", len(cold_tickers), inter_batch_delay)
+            time.sleep(inter_batch_delay)
+            
+            retry_results = self.process_batch(cold_tickers)
+            dropped_stocks.extend(retry_results)
+            self.write_results_to_csv(retry_results)
+            self.mark_completed(cold_tickers)
+            self.save_progress(dropped_stocks)
+            
+            self.failed_requests.extend(self.cold_tickers)
+            self.cold_tickers = []
+
+        # Display results
+        self.display_results(dropped_stocks)
+        
+        # Save results to CSV
+        if dropped_stocks:
+            self.save_results_to_csv(dropped_stocks)
+        
+        # Report failed requests
+        if self.failed_requests:
+            logger.warning("Failed to process %d tickers: %s...", len(self.failed_requests), self.failed_requests[:10])
+            print(f"\n⚠️  Failed to process {len(self.failed_requests)} tickers due to rate limiting or errors")
+
+    def display_results(self, dropped_stocks: List[StockResult]) -> None:
+        """Display analysis results in a formatted manner."""
+        
+        if not dropped_stocks:
+            print("\n🎉 No stocks found with significant drops today!")
+            return
+            
+        # Sort by percentage change (most negative first)
+        dropped_stocks.sort(key=attrgetter('percent_change'))
+        
+        # Build the summary table and write it in one go
+        rule = "-" * 120
+        market_caps = _format_market_caps([stock.market_cap for stock in dropped_stocks])
+        rows = [
+            f"{stock.symbol:<8} "
+            f"{stock.company_name[:29]:<30} "
+            f"{stock.sector[:19]:<20} "
+            f"{stock.percent_change:>7.2f}% "
+            f"${stock.current_price:>8.2f} "
+            f"{market_cap:<10} "
+            f"{stock.distance_from_high:>10.1f}%"
+            for stock, market_cap in zip(dropped_stocks, market_caps)
+        ]
+        print("\n".join([
+            f"\n📉 Found {len(dropped_stocks)} stocks with significant drops:",
+            rule,
+            f"{'Symbol':<8} {'Company':<30} {'Sector':<20} {'Change':<8} {'Price':<10} {'Mkt Cap':<10} {'From 52W High':<12}",
+            rule,
+            *rows,
+            rule
+        ]))
+        
+        # Show detailed analysis for top 5 drops (increased from 3 for larger dataset)
+        print(f"\n📊 DETAILED ANALYSIS - Top 5 Drops:")
+        print("="*80)
+        
+        for i, stock in enumerate(dropped_stocks[:5], 1):
+            print(f"\n{i}. {stock.symbol} - {stock.company_name}")
+            print(f"   Sector: {stock.sector}")
+            print(f"   Price Change: ${stock.previous_close:.2f} → ${stock.current_price:.2f} ({stock.percent_change:.2f}%)")
+            print(f"   Market Cap: {self.format_market_cap(stock.market_cap)}")
+            print(f"   52-Week Range: ${stock.fifty_two_week_low:.2f} - ${stock.fifty_two_week_high:.2f}")
+            print(f"   Volume: {stock.volume:,.0f} (Avg: {stock.avg_volume:,.0f})")
+            
+            # Display fundamental ratios
+            print(f"\n   📈 FUNDAMENTAL METRICS:")
+            pe_ratio = stock.pe_ratio
+            peg_ratio = stock.peg_ratio
+            debt_to_equity = stock.debt_to_equity
+            dividend_yield = stock.dividend_yield
+            free_cash_flow = self.format_large_number(stock.free_cash_flow)
+            
+            print(f"   • P/E Ratio: {pe_ratio}")
+            print(f"   • PEG Ratio: {peg_ratio}")
+            print(f"   • Debt-to-Equity: {debt_to_equity}")
+            print(f"   • Dividend Yield: {dividend_yield}%" if dividend_yield != 'N/A' else f"   • Dividend Yield: {dividend_yield}")
+            print(f"   • Free Cash Flow: {free_cash_flow}")
+            
+            # Display technical indicators
+            print(f"\n   📊 TECHNICAL INDICATORS:")
+            rsi = stock.rsi
+            macd = stock.macd
+            macd_signal = stock.macd_signal
+            obv = stock.obv
+            
+            print(f"   • RSI (14): {rsi}")
+            print(f"   • MACD: {macd}")
+            print(f"   • MACD Signal: {macd_signal}")
+            print(f"   • OBV: {obv:,}" if obv != 'N/A' else f"   • OBV: {obv}")
+            
+            # RSI interpretation
+            if rsi != 'N/A':
+                if rsi < 30:
+                    print(f"     → RSI indicates oversold conditions")
+                elif rsi > 70:
+                    print(f"     → RSI indicates overbought conditions")
+                else:
+                    print(f"     → RSI indicates neutral conditions")
+            
+            # Get and display news
+            news = self.get_stock_news(stock.symbol)
+            if news:
+                print(f"\n   📰 RECENT NEWS:")
+                for item in news:
+                    print(f"     • {item['title'][:80]}...")
+                    print(f"       {item['publisher']} - {item['published']}")
+            else:
+                print(f"\n   📰 No recent news available")
+            
+            print("-" * 80)
+
+    def write_results_to_csv(self, results: List[StockResult]) -> None:
+        """Append results to the results CSV, creating the file on first use."""
+        if not results:
+            return
+        
+        try:
+            if self.results_writer is None:
+                self.results_filename = f"fortune5000_drops_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+                self.results_file = open(self.results_filename, 'w', newline='', encoding='utf-8')
+                self.results_writer = csv.writer(self.results_file)
+                self.results_writer.writerow(STOCK_RESULT_FIELDS)
+            
+            self.results_writer.writerows(map(_stock_result_row, results))
+            self.results_file.flush()
+        except Exception as e:
+            logger.error("Error saving results to CSV: %s", e)
+
+    def save_results_to_csv(self, dropped_stocks: List[StockResult]) -> None:
+        """Save results to a CSV file, finishing the file written during the analysis."""
+        if self.results_writer is None:
+            self.write_results_to_csv(dropped_stocks)
+        
+        if self.results_file is None:
+            return
+        
+        self.results_file.close()
+        self.results_file = None
+        self.results_writer = None
+        
+        logger.info("Results saved to %s", self.results_filename)
+        print(f"\n💾 Results saved to: {self.results_filename}")
+
+
+def run(preset: str = 'balanced', drop_threshold: float = -1.0) -> None:
+    """
+    Run the full analysis in the current process.
+    
+    Args:
+        preset: Rate limiting preset ('aggressive', 'balanced', 'conservative', 'ultra_conservative')
+        drop_threshold: Minimum percentage drop to flag (default: -1%)
+    """
+    try:
+        logger.info("Using rate limiting preset: %s", preset)
+        logger.info("Using drop threshold: %s%%", drop_threshold)
+
+        # Create analyzer instance
+        analyzer = Fortune5000Analyzer(
+            drop_threshold=drop_threshold,
+            rate_limit_preset=preset
+        )
+        
+        # Run analysis
+        analyzer.analyze_us_stocks()
+        
+    except KeyboardInterrupt:
+        logger.info("Analysis interrupted by user")
+        print("\n⚠️  Analysis interrupted by user")
+    except Exception as e:
+        logger.error("Unexpected error: %s", e)
+        print(f"\n❌ An error occurred: {e}")
+
+
+def main():
+    """Main function to run the analysis."""
+    import sys
+    
+    preset = 'balanced'  # Default preset
+    drop_threshold_val = -1.0  # Default drop threshold
+
+    if len(sys.argv) > 1:
+        # First argument is preset
+        preset_arg = sys.argv[1].lower()
+        if preset_arg in ['aggressive', 'balanced', 'conservative', 'ultra_conservative']:
+            preset = preset_arg
+        else:
+            # Check if the first argument is a number (for drop_threshold if preset is omitted)
+            try:
+                drop_threshold_val = float(preset_arg)
+                # If it's a number, preset remains 'balanced' (default)
+            except ValueError:
+                print(f"Invalid preset or drop threshold: {sys.argv[1]}")
+                print("Usage: python fortune5000_analysis.py [preset] [drop_threshold]")
+                print("Valid presets: aggressive, balanced, conservative, ultra_conservative")
+                print("Drop threshold: e.g., -5.0 for a 5% drop")
+                return
+        
+        # Second argument is drop_threshold (if preset was also provided)
+        if len(sys.argv) > 2 and preset_arg in ['aggressive', 'balanced', 'conservative', 'ultra_conservative']:
+            try:
+                drop_threshold_val = float(sys.argv[2])
+            except ValueError:
+                print(f"Invalid drop threshold: {sys.argv[2]}")
+                print("Drop threshold must be a number (e.g., -5.0).")
+                return
+        elif len(sys.argv) > 2: # User provided two args, neither was a valid preset
+             print(f"Invalid preset: {sys.argv[1]}")
+             print("Usage: python fortune5000_analysis.py [preset] [drop_threshold]")
+             print("Valid presets: aggressive, balanced, conservative, ultra_conservative")
+             return
+    
+    run(preset, drop_threshold_val)
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -5,96 +5,126 @@ This script helps you get started with the right configuration.
 """
 
 import os
-import sys
-from rate_limit_config import print_config_info
+from functools import partial
+
+BANNER = "🚀 Fortune 5000 Analysis - Quick Start Guide\n" + "=" * 50
+
+MENU = """✅ All required files found!
+
+📋 Available Options:
+1. 🧪 Test rate limiting (recommended first step)
+2. 🏃 Run full analysis with interactive preset selection
+3. 📊 View detailed configuration information
+4. 📖 Read the rate limiting documentation
+5. ⚡ Quick run with balanced preset
+6. 🐌 Quick run with conservative preset (if experiencing issues)"""
+
+TIPS = "\n" + "=" * 50 + """
+💡 Tips for Success:
+• Start with the test script to verify everything works
+• Use 'balanced' preset for most situations
+• Switch to 'conservative' if you get rate limited
+• Monitor the logs for any error messages
+• The analysis can take 2-4 hours for all ~8000 stocks
+• You can interrupt with Ctrl+C and resume later"""
 
 def main():
-    print("🚀 Fortune 5000 Analysis - Quick Start Guide")
-    print("=" * 50)
+    print(BANNER)
     
     # Check if required files exist
     required_files = [
         'us_public_tickers.csv',
-        'fortune5000-analysis.py',
+        'fortune5000_analysis.py',
         'rate_limit_config.py',
         'run_analysis.py'
     ]
     
-    missing_files = [f for f in required_files if not os.path.exists(f)]
+    # One directory listing answers every membership check below
+    with os.scandir('.') as entries:
+        present = {entry.name for entry in entries}
+    
+    missing_files = [f for f in required_files if f not in present]
     
     if missing_files:
-        print("❌ Missing required files:")
-        for file in missing_files:
-            print(f"   - {file}")
-        print("\nPlease ensure all files are in the current directory.")
+        print("❌ Missing required files:\n" +
+              "".join(f"   - {file}\n" for file in missing_files) +
+              "\nPlease ensure all files are in the current directory.")
         return
     
-    print("✅ All required files found!")
+    print(MENU)
     
-    print("\n📋 Available Options:")
-    print("1. 🧪 Test rate limiting (recommended first step)")
-    print("2. 🏃 Run full analysis with interactive preset selection")
-    print("3. 📊 View detailed configuration information")
-    print("4. 📖 Read the rate limiting documentation")
-    print("5. ⚡ Quick run with balanced preset")
-    print("6. 🐌 Quick run with conservative preset (if experiencing issues)")
+    # Menu choice -> (action, whether to show the menu again afterwards)
+    actions = {
+        '1': (test_rate_limiting, False),
+        '2': (run_interactive_analysis, False),
+        '3': (show_config_details, True),
+        '4': (partial(show_documentation, present), True),
+        '5': (partial(quick_run, 'balanced'), False),
+        '6': (partial(quick_run, 'conservative'), False),
+    }
     
     while True:
         try:
             choice = input("\nWhat would you like to do? (1-6): ").strip()
             
-            if choice == '1':
-                print("\n🧪 Testing rate limiting...")
-                print("This will test with 10 stocks to verify everything works.")
-                os.system(f"{sys.executable} test_rate_limiting.py balanced 10")
-                break
-                
-            elif choice == '2':
-                print("\n🏃 Starting interactive analysis...")
-                os.system(f"{sys.executable} run_analysis.py")
-                break
-                
-            elif choice == '3':
-                print("\n📊 Configuration Details:")
-                print_config_info()
-                continue
-                
-            elif choice == '4':
-                print("\n📖 Rate Limiting Documentation:")
-                print("Please read README-RateLimiting.md for detailed information.")
-                if os.path.exists('README-RateLimiting.md'):
-                    print("File found in current directory.")
-                else:
-                    print("Documentation file not found.")
+            entry = actions.get(choice)
+            if entry is None:
+                print("Invalid choice. Please enter 1-6.")
                 continue
-                
-            elif choice == '5':
-                print("\n⚡ Running with balanced preset...")
-                print("This is the recommended setting for most users.")
-                os.system(f"{sys.executable} fortune5000-analysis.py balanced")
-                break
-                
-            elif choice == '6':
-                print("\n🐌 Running with conservative preset...")
-                print("This is slower but safer if you're experiencing rate limits.")
-                os.system(f"{sys.executable} fortune5000-analysis.py conservative")
+            
+            action, show_menu_again = entry
+            action()
+            if not show_menu_again:
                 break
                 
-            else:
-                print("Invalid choice. Please enter 1-6.")
-                
         except KeyboardInterrupt:
             print("\n\nExiting...")
             break
     
-    print("\n" + "=" * 50)
-    print("💡 Tips for Success:")
-    print("• Start with the test script to verify everything works")
-    print("• Use 'balanced' preset for most situations")
-    print("• Switch to 'conservative' if you get rate limited")
-    print("• Monitor the logs for any error messages")
-    print("• The analysis can take 2-4 hours for all ~8000 stocks")
-    print("• You can interrupt with Ctrl+C and resume later")
+    print(TIPS)
+
+def test_rate_limiting():
+    """Run the rate limiting test against 10 stocks."""
+    print("\n🧪 Testing rate limiting...")
+    print("This will test with 10 stocks to verify everything works.")
+    import test_rate_limiting
+    test_rate_limiting.main(['balanced', '10'])
+
+def run_interactive_analysis():
+    """Run the full analysis with the interactive preset menu."""
+    print("\n🏃 Starting interactive analysis...")
+    import run_analysis
+    run_analysis.main([])
+
+def show_config_details():
+    """Show the available rate limiting presets."""
+    print("\n📊 Configuration Details:")
+    from rate_limit_config import print_config_info
+    print_config_info()
+
+def show_documentation(present):
+    """Point to the rate limiting documentation, noting whether it is in the current directory."""
+    print("\n📖 Rate Limiting Documentation:")
+    print("Please read README-RateLimiting.md for detailed information.")
+    if 'README-RateLimiting.md' in present:
+        print("File found in current directory.")
+    else:
+        print("Documentation file not found.")
+
+# Quick-run presets -> the explanation shown before starting
+QUICK_RUN_MESSAGES = {
+    'balanced': ("\n⚡ Running with balanced preset...",
+                 "This is the recommended setting for most users."),
+    'conservative': ("\n🐌 Running with conservative preset...",
+                     "This is slower but safer if you're experiencing rate limits."),
+}
+
+def quick_run(preset):
+    """Run the full analysis straight away with the given preset."""
+    for line in QUICK_RUN_MESSAGES[preset]:
+        print(line)
+    import run_analysis
+    run_analysis.run_analysis(preset)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -3,6 +3,9 @@ Rate limiting configuration for Fortune 5000 stock analysis.
 Adjust these parameters based on your API limits and performance needs.
 """
 
+import sys
+from types import MappingProxyType
+
 # Rate limiting configuration
 RATE_LIMIT_CONFIG = {
     # Basic settings
@@ -13,7 +16,12 @@ RATE_LIMIT_CONFIG = {
     # Advanced settings
     'inter_batch_delay': (2.0, 5.0),  # Delay between batches (min, max) in seconds
     'max_retries': 3,  # Maximum number of retries for failed requests
-    'exponential_backoff_base': 1.0,  # Base delay for exponential backoff
+    'exponential_backoff_base': 1.0,  # Shortest backoff; later retries draw from (base, 3 x previous delay)
+    
+    # Adaptive request rate (additive increase, multiplicative decrease)
+    'adaptive_window': 30.0,  # Seconds of responses judged together before adjusting the rate
+    'adaptive_max_error_rate': 0.05,  # Halve the rate when more than this share of requests hit 429
+    'adaptive_increase': 0.1,  # Fraction of the preset rate added back after a healthy window
     
     # Conservative settings (use if still getting rate limited)
     'conservative_mode': False,  # Enable for stricter rate limiting
@@ -30,27 +38,56 @@ PRESETS = {
         'batch_size': 100,
         'delay_range': (0.2, 1.0),
         'inter_batch_delay': (1.0, 3.0),
+        'requests_per_second': 8.0,  # Token bucket refill rate shared by all workers
+        'burst': 5,  # Requests allowed back to back when the bucket is full
+        'backoff_cap': 30.0,  # Longest retry backoff in seconds
     },
     'balanced': {
         'max_workers': 2,
         'batch_size': 30,
         'delay_range': (1.0, 3.0),
         'inter_batch_delay': (3.0, 6.0),
+        'requests_per_second': 1.0,  # Token bucket refill rate shared by all workers
+        'burst': 2,  # Requests allowed back to back when the bucket is full
+        'backoff_cap': 60.0,  # Longest retry backoff in seconds
     },
     'conservative': {
         'max_workers': 1,
         'batch_size': 20,
         'delay_range': (1.0, 3.0),
         'inter_batch_delay': (5.0, 10.0),
+        'requests_per_second': 0.5,  # Token bucket refill rate shared by all workers
+        'burst': 1,  # Requests allowed back to back when the bucket is full
+        'backoff_cap': 60.0,  # Longest retry backoff in seconds
     },
     'ultra_conservative': {
         'max_workers': 1,
         'batch_size': 10,
         'delay_range': (2.0, 5.0),
         'inter_batch_delay': (10.0, 20.0),
+        'requests_per_second': 0.3,  # Token bucket refill rate shared by all workers
+        'burst': 1,  # Requests allowed back to back when the bucket is full
+        'backoff_cap': 120.0,  # Longest retry backoff in seconds
     }
 }
 
+def compute_estimate(config):
+    """
+    Estimate how long a preset takes, in seconds per stock and per batch.
+    
+    Returns:
+        Dictionary with 'per_stock', 'per_batch' and 'per_1000_minutes'
+    """
+    per_stock = 1 / config['requests_per_second']
+    per_batch = config['batch_size'] * per_stock
+    inter_batch = (config['inter_batch_delay'][0] + config['inter_batch_delay'][1]) / 2
+    
+    return {
+        'per_stock': per_stock,
+        'per_batch': per_batch,
+        'per_1000_minutes': (per_batch + inter_batch) * (1000 / config['batch_size']) / 60,
+    }
+
 def get_config(preset='balanced'):
     """
     Get rate limiting configuration.
@@ -59,31 +96,31 @@ def get_config(preset='balanced'):
         preset: Configuration preset ('aggressive', 'balanced', 'conservative', 'ultra_conservative')
         
     Returns:
-        Dictionary with rate limiting parameters
+        Read-only mapping with rate limiting parameters
     """
     if preset in PRESETS:
-        return PRESETS[preset]
+        return MappingProxyType(PRESETS[preset])
     else:
-        return PRESETS['balanced']
+        return MappingProxyType(PRESETS['balanced'])
 
-def print_config_info():
-    """Print information about available configurations."""
-    print("Available Rate Limiting Presets:")
-    print("=" * 50)
+def _config_info_text():
+    """Render the preset overview from the current presets."""
+    lines = ["Available Rate Limiting Presets:", "=" * 50]
     
     for preset_name, config in PRESETS.items():
-        print(f"\n{preset_name.upper()}:")
-        print(f"  Max Workers: {config['max_workers']}")
-        print(f"  Batch Size: {config['batch_size']}")
-        print(f"  Delay Range: {config['delay_range'][0]}-{config['delay_range'][1]}s")
-        print(f"  Inter-batch Delay: {config['inter_batch_delay'][0]}-{config['inter_batch_delay'][1]}s")
-        
-        # Estimate time
-        estimated_time_per_stock = (config['delay_range'][0] + config['delay_range'][1]) / 2
-        estimated_time_per_batch = config['batch_size'] * estimated_time_per_stock / config['max_workers']
-        estimated_inter_batch = (config['inter_batch_delay'][0] + config['inter_batch_delay'][1]) / 2
-        
-        print(f"  Est. time per 1000 stocks: {((estimated_time_per_batch + estimated_inter_batch) * (1000 / config['batch_size']) / 60):.1f} minutes")
+        lines.append(f"\n{preset_name.upper()}:")
+        lines.append(f"  Max Workers: {config['max_workers']}")
+        lines.append(f"  Batch Size: {config['batch_size']}")
+        lines.append(f"  Inter-batch Delay: {config['inter_batch_delay'][0]}-{config['inter_batch_delay'][1]}s")
+        lines.append(f"  Request Rate: {config['requests_per_second']}/s (burst {config['burst']})")
+        lines.append(f"  Est. time per 1000 stocks: {compute_estimate(config)['per_1000_minutes']:.1f} minutes")
+    
+    return "\n".join(lines)
+
+def print_config_info():
+    """Print information about available configurations."""
+    sys.stdout.write(_config_info_text() + "\n")
+    sys.stdout.flush()
 
 if __name__ == "__main__":
     print_config_info()
\ No newline at end of file
@@ -5,18 +5,28 @@ This makes it easy to choose the right configuration for your needs.
 """
 
 import sys
-import subprocess
+from functools import partial
 from rate_limit_config import print_config_info, PRESETS
 
-def main():
+def main(argv=None):
+    """
+    Run the analysis from the command line or the interactive preset menu.
+    
+    Args:
+        argv: Command line arguments (defaults to sys.argv[1:])
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    
     print("Fortune 5000 Stock Analysis - Rate Limiting Configuration")
     print("=" * 60)
     
-    if len(sys.argv) > 1:
-        preset = sys.argv[1].lower()
+    if argv:
+        preset = argv[0].lower()
         if preset in PRESETS:
             print(f"Running analysis with '{preset}' preset...")
-            subprocess.run([sys.executable, "fortune5000-analysis.py", preset])
+            import fortune5000_analysis
+            fortune5000_analysis.run(preset)
             return
         elif preset in ['help', '-h', '--help']:
             print_help()
@@ -39,26 +49,15 @@ def main():
         try:
             choice = input("\nEnter your choice (1-6): ").strip()
             
-            if choice == '1':
-                run_analysis('aggressive')
-                break
-            elif choice == '2':
-                run_analysis('balanced')
-                break
-            elif choice == '3':
-                run_analysis('conservative')
-                break
-            elif choice == '4':
-                run_analysis('ultra_conservative')
-                break
-            elif choice == '5':
-                print_config_info()
+            entry = MENU_ACTIONS.get(choice)
+            if entry is None:
+                print("Invalid choice. Please enter 1-6.")
                 continue
-            elif choice == '6':
-                print("Exiting...")
+            
+            action, show_menu_again = entry
+            action()
+            if not show_menu_again:
                 break
-            else:
-                print("Invalid choice. Please enter 1-6.")
                 
         except KeyboardInterrupt:
             print("\nExiting...")
@@ -71,7 +70,9 @@ def run_analysis(preset):
     print("-" * 50)
     
     try:
-        subprocess.run([sys.executable, "fortune5000-analysis.py", preset])
+        # Imported on first use so the menu starts without loading pandas/yfinance
+        import fortune5000_analysis
+        fortune5000_analysis.run(preset)
     except KeyboardInterrupt:
         print("\nAnalysis interrupted by user.")
 
@@ -88,5 +89,15 @@ def print_help():
     print("\nFor interactive mode, run without arguments:")
     print("  python run_analysis.py")
 
+# Menu choice -> (action, whether to show the menu again afterwards)
+MENU_ACTIONS = {
+    '1': (partial(run_analysis, 'aggressive'), False),
+    '2': (partial(run_analysis, 'balanced'), False),
+    '3': (partial(run_analysis, 'conservative'), False),
+    '4': (partial(run_analysis, 'ultra_conservative'), False),
+    '5': (print_config_info, True),
+    '6': (partial(print, "Exiting..."), False),
+}
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Test that comparison-analysis.py reports the same results from a CSV file
+and from the Parquet file converted from it
+"""
+
+import importlib.util
+import io
+import os
+import re
+import shutil
+import sys
+import tempfile
+from contextlib import redirect_stdout
+
+import pandas as pd
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+SAMPLE_CSV = os.path.join(HERE, "fortune5000_drops_20250614_131341.csv")
+
+# comparison-analysis.py is not importable by name because of the hyphen
+_spec = importlib.util.spec_from_file_location(
+    "comparison_analysis", os.path.join(HERE, "comparison-analysis.py"))
+comparison = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(comparison)
+
+def render_report(path):
+    """Render the summary report for a single result file, without the timestamp line"""
+    data = comparison.read_results(path)
+    original_loader = comparison.load_latest_results
+    comparison.load_latest_results = lambda: (None, data)
+    try:
+        output = io.StringIO()
+        with redirect_stdout(output):
+            comparison.generate_summary_report()
+    finally:
+        comparison.load_latest_results = original_loader
+    return re.sub(r"Generated: .*", "", output.getvalue())
+
+def test_parquet_report_matches_csv():
+    """Empty sector and company cells must stay null through the Parquet conversion"""
+    if comparison.pq is None:
+        print("pyarrow not installed - skipping Parquet comparison")
+        return
+    
+    tmpdir = tempfile.mkdtemp()
+    try:
+        # Blank the sector and company name of a few rows, as yfinance leaves them for some tickers
+        sample = pd.read_csv(SAMPLE_CSV)
+        sample.loc[sample.index[:3], ['company_name', 'sector']] = None
+        csv_path = os.path.join(tmpdir, "fortune5000_drops_test.csv")
+        sample.to_csv(csv_path, index=False)
+        
+        parquet_path = comparison.convert_results_to_parquet(csv_path)
+        
+        csv_report = render_report(csv_path)
+        parquet_report = render_report(parquet_path)
+        assert csv_report == parquet_report, "CSV and Parquet reports differ"
+        
+        sectors = pd.read_parquet(parquet_path, columns=['sector'])['sector']
+        assert sectors.isna().sum() == 3, "empty sectors were not stored as nulls"
+        print("✓ CSV and Parquet reports match")
+    finally:
+        shutil.rmtree(tmpdir)
+
+if __name__ == "__main__":
+    try:
+        test_parquet_report_matches_csv()
+    except AssertionError as e:
+        print(f"✗ {e}")
+        sys.exit(1)
@@ -1,17 +1,11 @@
 #!/usr/bin/env python3
 """
-Test the fixed fortune5000-analysis.py script with a small sample
+Test the fixed fortune5000_analysis.py script with a small sample
 """
 
 import sys
 import os
-import importlib.util
-
-# Import the Fortune5000Analyzer class from the script file
-spec = importlib.util.spec_from_file_location("fortune5000_analysis", "fortune5000-analysis.py")
-fortune5000_module = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(fortune5000_module)
-Fortune5000Analyzer = fortune5000_module.Fortune5000Analyzer
+from fortune5000_analysis import Fortune5000Analyzer
 
 import logging
 
@@ -40,7 +34,7 @@ def test_small_sample():
             result = analyzer.analyze_single_stock(ticker)
             if result:
                 results.append(result)
-                print(f"    ✓ {ticker}: {result['percent_change']:.2f}% change")
+                print(f"    ✓ {ticker}: {result.percent_change:.2f}% change")
             else:
                 print(f"    - {ticker}: No significant drop")
         except Exception as e:
@@ -51,8 +45,8 @@ def test_small_sample():
     if results:
         print("\nDetailed results:")
         for result in results:
-            print(f"  {result['symbol']}: {result['percent_change']:.2f}% "
-                  f"(${result['previous_close']:.2f} → ${result['current_price']:.2f})")
+            print(f"  {result.symbol}: {result.percent_change:.2f}% "
+                  f"(${result.previous_close:.2f} → ${result.current_price:.2f})")
     
     return len(results) >= 0  # Success if no errors occurred
 
@@ -67,7 +61,7 @@ if __name__ == "__main__":
     if success:
         print("✓ Test completed successfully! The script should now work without 401 errors.")
         print("\nYou can now run the full analysis with:")
-        print("  python3 fortune5000-analysis.py conservative")
-        print("  python3 fortune5000-analysis.py balanced")
+        print("  python3 fortune5000_analysis.py conservative")
+        print("  python3 fortune5000_analysis.py balanced")
     else:
         print("✗ Test failed. There may still be issues to resolve.")
\ No newline at end of file
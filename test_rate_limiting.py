@@ -4,23 +4,54 @@ Test script to verify rate limiting is working properly.
 Tests with a small subset of stocks to validate the implementation.
 """
 
+import argparse
+import json
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
 from fortune5000_analysis import Fortune5000Analyzer
-from rate_limit_config import get_config, print_config_info
+from rate_limit_config import get_config, PRESETS
 import logging
 
 # Configure logging for testing
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-def test_rate_limiting(preset='balanced', num_stocks=10):
+# Ticker list shared by repeated test runs in one process (it does not depend on the preset)
+_TICKERS = None
+
+def load_tickers(analyzer):
+    """Load the ticker list once per process."""
+    global _TICKERS
+    if not _TICKERS:
+        _TICKERS = analyzer.get_fortune5000_tickers()
+    return _TICKERS
+
+class timed:
+    """Context manager that times a block with perf_counter and reports how long it took."""
+    
+    def __init__(self, label):
+        self.label = label
+        self.elapsed = 0.0
+    
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.elapsed = time.perf_counter() - self.start
+        print(f"   {self.label} took {self.elapsed:.3f} seconds")
+
+def test_rate_limiting(preset='balanced', num_stocks=10, offset=0, sync_news=False):
     """
     Test rate limiting with a small subset of stocks.
     
     Args:
         preset: Rate limiting preset to test
         num_stocks: Number of stocks to test with
+        offset: Index of the first ticker, so concurrent runs test disjoint slices
+        sync_news: Fetch news one ticker at a time instead of concurrently
     """
     print(f"Testing rate limiting with '{preset}' preset")
     print(f"Testing with {num_stocks} stocks")
@@ -30,59 +61,56 @@ def test_rate_limiting(preset='balanced', num_stocks=10):
     analyzer = Fortune5000Analyzer(drop_threshold=-0.1, rate_limit_preset=preset)  # Very low threshold to catch more stocks
     
     # Get a small subset of tickers for testing
-    all_tickers = analyzer.get_fortune5000_tickers()
+    all_tickers = load_tickers(analyzer)
     if not all_tickers:
         print("❌ Failed to load tickers")
         return False
     
-    test_tickers = all_tickers[:num_stocks]
-    print(f"Testing with tickers: {test_tickers}")
+    test_tickers = all_tickers[offset:offset + num_stocks]
+    logger.info("Testing with tickers: %s", test_tickers)
     
     # Test single stock analysis
     print("\n1. Testing single stock analysis...")
-    start_time = time.time()
-    
     test_ticker = test_tickers[0]
-    result = analyzer.analyze_single_stock(test_ticker)
-    
-    elapsed = time.time() - start_time
-    print(f"   Single stock analysis took {elapsed:.2f} seconds")
+    with timed("Single stock analysis"):
+        result = analyzer.analyze_single_stock(test_ticker)
     
     if result:
-        print(f"   ✅ Successfully analyzed {test_ticker}")
-        print(f"   Company: {result.get('company_name', 'Unknown')}")
-        print(f"   Price change: {result.get('percent_change', 0):.2f}%")
+        logger.info("Successfully analyzed %s (%s): %.2f%% price change",
+                    test_ticker, result.company_name, result.percent_change)
     else:
-        print(f"   ℹ️  {test_ticker} didn't meet drop threshold or had no data")
+        logger.info("%s didn't meet drop threshold or had no data", test_ticker)
     
-    # Test batch processing
-    print(f"\n2. Testing batch processing with {len(test_tickers)} stocks...")
-    start_time = time.time()
+    # Test batch processing; the first ticker was already analyzed above, so reuse its result
+    batch_tickers = test_tickers[1:]
+    print(f"\n2. Testing batch processing with {len(batch_tickers)} stocks...")
+    with timed("Batch processing") as batch_timer:
+        batch_results = ([result] if result else []) + analyzer.process_batch(batch_tickers)
     
-    batch_results = analyzer.process_batch(test_tickers)
-    
-    elapsed = time.time() - start_time
-    print(f"   Batch processing took {elapsed:.2f} seconds")
     print(f"   Found {len(batch_results)} stocks meeting criteria")
-    print(f"   Average time per stock: {elapsed/len(test_tickers):.2f} seconds")
+    print(f"   Average time per stock: {batch_timer.elapsed/max(1, len(batch_tickers)):.3f} seconds")
     
     # Test news fetching (additional API call)
     if batch_results:
-        print(f"\n3. Testing news fetching...")
-        start_time = time.time()
-        
-        news = analyzer.get_stock_news(batch_results[0]['symbol'])
-        
-        elapsed = time.time() - start_time
-        print(f"   News fetching took {elapsed:.2f} seconds")
-        print(f"   Found {len(news)} news items")
+        # The same top-5 drops the full analysis shows news for, fetched through the rate limiter
+        top_drops = sorted(batch_results, key=attrgetter('percent_change'))[:5]
+        news_symbols = [stock.symbol for stock in top_drops]
+        print(f"\n3. Testing news fetching for {len(news_symbols)} stocks...")
+        with timed("News fetching"):
+            if sync_news:
+                news = [analyzer.get_stock_news(symbol) for symbol in news_symbols]
+            else:
+                with ThreadPoolExecutor(max_workers=analyzer.max_workers) as executor:
+                    news = list(executor.map(analyzer.get_stock_news, news_symbols))
+        for symbol, items in zip(news_symbols, news):
+            logger.info("Found %d news items for %s", len(items), symbol)
     
     # Summary
-    print(f"\n📊 Test Summary:")
-    print(f"   Request count: {analyzer.request_count}")
-    print(f"   Failed requests: {len(analyzer.failed_requests)}")
-    print(f"   Configuration: {analyzer.max_workers} workers, {analyzer.batch_size} batch size")
-    print(f"   Delay range: {analyzer.delay_range[0]}-{analyzer.delay_range[1]}s")
+    print(f"\n📊 Test Summary:\n"
+          f"   Request count: {analyzer.request_count}\n"
+          f"   Failed requests: {len(analyzer.failed_requests)}\n"
+          f"   Configuration: {analyzer.max_workers} workers, {analyzer.batch_size} batch size\n"
+          f"   Request rate: {analyzer.requests_per_second}/s (burst {analyzer.burst})")
     
     if analyzer.failed_requests:
         print(f"   ⚠️  Some requests failed: {analyzer.failed_requests}")
@@ -91,43 +119,85 @@ def test_rate_limiting(preset='balanced', num_stocks=10):
         print(f"   ✅ All requests successful!")
         return True
 
-def main():
-    """Main test function."""
+def build_parser():
+    """Build the command line parser."""
+    parser = argparse.ArgumentParser(
+        description="Test rate limiting with a small subset of stocks.",
+        epilog="Example: python test_rate_limiting.py conservative 5"
+    )
+    parser.add_argument('preset', nargs='?', default='balanced',
+                        help="Preset to test: " + ", ".join(PRESETS))
+    parser.add_argument('num_stocks', nargs='?', type=int, default=10,
+                        help="Number of stocks to test with (default: 10)")
+    parser.add_argument('--presets', nargs='+', metavar='PRESET',
+                        help="Test several presets concurrently, each on its own slice of tickers")
+    parser.add_argument('--sync-news', action='store_true',
+                        help="Fetch news sequentially, for comparison with the concurrent default")
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help="List each configuration value even when output is not a terminal")
+    parser.add_argument('-q', '--quiet', action='store_true',
+                        help="Only log warnings; per-step details are skipped")
+    return parser
+
+def report_result(preset, success):
+    """Print the verdict for one preset."""
+    if success:
+        print(f"\n🎉 Rate limiting test PASSED for '{preset}' preset!")
+        print("You can now run the full analysis with confidence.")
+    else:
+        print(f"\n❌ Rate limiting test FAILED for '{preset}' preset.")
+        print("Consider using a more conservative preset.")
+        print("\nTry running: python test_rate_limiting.py conservative 5")
+
+def main(argv=None):
+    """
+    Main test function.
+    
+    Args:
+        argv: Command line arguments (defaults to sys.argv[1:])
+    """
     print("Rate Limiting Test Suite")
     print("=" * 30)
     
-    if len(sys.argv) > 1:
-        if sys.argv[1] in ['help', '-h', '--help']:
-            print("Usage: python test_rate_limiting.py [preset] [num_stocks]")
-            print("Presets: aggressive, balanced, conservative, ultra_conservative")
-            print("Example: python test_rate_limiting.py conservative 5")
-            return
-        
-        preset = sys.argv[1]
-        num_stocks = int(sys.argv[2]) if len(sys.argv) > 2 else 10
-    else:
-        preset = 'balanced'
-        num_stocks = 10
+    parser = build_parser()
+    if argv is None:
+        argv = sys.argv[1:]
+    if argv[:1] == ['help']:
+        parser.print_help()
+        return
+    args = parser.parse_args(argv)
+    if args.quiet:
+        logging.getLogger().setLevel(logging.WARNING)
+    
+    presets = args.presets or [args.preset]
+    num_stocks = args.num_stocks
     
-    print(f"Testing preset: {preset}")
+    print(f"Testing preset: {', '.join(presets)}")
     print(f"Number of test stocks: {num_stocks}")
     
-    # Show configuration info
-    config = get_config(preset)
-    print(f"\nConfiguration:")
-    for key, value in config.items():
-        print(f"  {key}: {value}")
+    # Show configuration info: readable on a terminal, one JSON line per preset when piped to a log
+    for preset in presets:
+        config = get_config(preset)
+        heading = f"\nConfiguration ({preset}):" if len(presets) > 1 else "\nConfiguration:"
+        if args.verbose or sys.stdout.isatty():
+            print(heading + "\n" + "\n".join(f"  {key}: {value}" for key, value in config.items()))
+        else:
+            print(heading, json.dumps(dict(config)))
     
     print("\nStarting test...")
-    success = test_rate_limiting(preset, num_stocks)
-    
-    if success:
-        print(f"\n🎉 Rate limiting test PASSED for '{preset}' preset!")
-        print("You can now run the full analysis with confidence.")
+    if len(presets) == 1:
+        results = [test_rate_limiting(presets[0], num_stocks, sync_news=args.sync_news)]
     else:
-        print(f"\n❌ Rate limiting test FAILED for '{preset}' preset.")
-        print("Consider using a more conservative preset.")
-        print("\nTry running: python test_rate_limiting.py conservative 5")
+        # Each analyzer has its own token bucket, so the presets run side by side on disjoint tickers
+        with ThreadPoolExecutor(max_workers=len(presets)) as executor:
+            results = list(executor.map(
+                lambda index: test_rate_limiting(presets[index], num_stocks, offset=index * num_stocks,
+                                                 sync_news=args.sync_news),
+                range(len(presets))
+            ))
+    
+    for preset, success in zip(presets, results):
+        report_result(preset, success)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -4,86 +4,141 @@ Test script to verify yfinance 401 error fix
 """
 
 import yfinance as yf
+import random
 import requests
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
-import time
+
+try:
+    from yfinance.const import USER_AGENTS
+except ImportError:  # Older yfinance releases do not ship a User-Agent list
+    USER_AGENTS = [
+        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    ]
+
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+_PRINT_LOCK = threading.Lock()
+
+def say(message):
+    """Print one whole line; the tests run concurrently and share stdout"""
+    with _PRINT_LOCK:
+        print(message, flush=True)
+
+def get_session():
+    """Build the shared browser-like session once; later calls reuse its connection pool"""
+    global _SESSION
+    with _SESSION_LOCK:  # The session and batch tests may ask for it at the same time
+        if _SESSION is None:
+            session = requests.Session()
+            
+            # Add headers to mimic a real browser
+            session.headers.update({
+                'User-Agent': random.choice(USER_AGENTS),  # A different browser on each run
+                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+                'Accept-Language': 'en-US,en;q=0.5',
+                'Accept-Encoding': 'gzip, deflate',
+                'Connection': 'keep-alive',
+                'Upgrade-Insecure-Requests': '1',
+            })
+            
+            # Add retry strategy; pooled connections stay open between tests
+            retry_strategy = Retry(
+                total=3,
+                backoff_factor=1,
+                status_forcelist=[429, 500, 502, 503, 504],
+            )
+            adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retry_strategy)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            
+            _SESSION = session
+        return _SESSION
+
+def classify_error(error):
+    """Classify an exception as 'ratelimit', 'auth' or 'other' from its status code and text"""
+    message = str(error).lower()
+    if "429" in message or "rate limit" in message or "too many requests" in message:
+        return "ratelimit"
+    if "401" in message or "unauthorized" in message:
+        return "auth"
+    return "other"
 
 def test_basic_yfinance():
-    """Test basic yfinance functionality"""
-    print("Testing basic yfinance...")
+    """
+    Test basic yfinance functionality; returns (passed, error kind or None)
+    
+    yfinance keeps one process-wide session and yf.Ticker(..., session=...) replaces it,
+    so this only exercises yfinance's own session if it runs before the other probes.
+    """
+    say("Testing basic yfinance...")
     try:
         ticker = yf.Ticker("AAPL")
-        hist = ticker.history(period="5d")
-        print(f"✓ Basic test passed - got {len(hist)} days of data")
-        return True
+        hist = ticker.history(period="5d", actions=False, auto_adjust=False)  # Only the row count is checked
+        say(f"✓ Basic test passed - got {len(hist)} days of data")
+        return True, None
     except Exception as e:
-        print(f"✗ Basic test failed: {e}")
-        return False
+        say(f"✗ Basic test failed: {e}")
+        return False, classify_error(e)
 
 def test_with_session():
     """Test yfinance with custom session and headers"""
-    print("\nTesting with custom session...")
+    say("\nTesting with custom session...")
     try:
-        # Create a session with proper headers
-        session = requests.Session()
-        
-        # Add headers to mimic a real browser
-        session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-        })
-        
-        # Add retry strategy
-        retry_strategy = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
-        
-        # Test with session
-        ticker = yf.Ticker("AAPL", session=session)
-        hist = ticker.history(period="5d")
+        # Test with the shared session
+        ticker = yf.Ticker("AAPL", session=get_session())
+        hist = ticker.history(period="5d", actions=False, auto_adjust=False)  # Only the row count is checked
         info = ticker.info
         
-        print(f"✓ Session test passed - got {len(hist)} days of data")
-        print(f"✓ Info test passed - company: {info.get('longName', 'Unknown')}")
+        say(f"✓ Session test passed - got {len(hist)} days of data")
+        say(f"✓ Info test passed - company: {info.get('longName', 'Unknown')}")
         return True
         
     except Exception as e:
-        print(f"✗ Session test failed: {e}")
+        say(f"✗ Session test failed: {e}")
         return False
 
 def test_multiple_tickers():
-    """Test multiple tickers with delays"""
-    print("\nTesting multiple tickers with delays...")
+    """Test multiple tickers in one batch download"""
+    say("\nTesting multiple tickers with one batch download...")
     try:
         tickers = ["AAPL", "MSFT", "GOOGL"]
         
+        # yf.download still sends one request per symbol; threads=False sends the three
+        # back to back rather than in parallel, a light enough load once the basic test
+        # has shown we are not rate limited
+        data = yf.download(
+            tickers=" ".join(tickers),
+            period="2d",
+            actions=False,
+            auto_adjust=False,  # Raw closes are enough for a connectivity check
+            group_by="ticker",
+            threads=False,
+            progress=False,
+            session=get_session()
+        )
+        
+        returned = set(data.columns.get_level_values(0))
+        
+        # Collect the per-ticker lines and print them as one block
+        lines = []
         for ticker_symbol in tickers:
-            print(f"  Testing {ticker_symbol}...")
-            ticker = yf.Ticker(ticker_symbol)
-            hist = ticker.history(period="2d")
+            lines.append(f"  Testing {ticker_symbol}...")
+            hist = data[ticker_symbol].dropna(subset=['Close']) if ticker_symbol in returned else None
             
-            if len(hist) > 0:
-                print(f"    ✓ {ticker_symbol}: ${hist['Close'].iloc[-1]:.2f}")
+            if hist is not None and len(hist) > 0:
+                lines.append(f"    ✓ {ticker_symbol}: ${hist['Close'].iloc[-1]:.2f}")
             else:
-                print(f"    ✗ {ticker_symbol}: No data")
-            
-            # Small delay between requests
-            time.sleep(0.5)
+                lines.append(f"    ✗ {ticker_symbol}: No data")
+        say("\n".join(lines))
         
         return True
         
     except Exception as e:
-        print(f"✗ Multiple ticker test failed: {e}")
+        say(f"✗ Multiple ticker test failed: {e}")
         return False
 
 if __name__ == "__main__":
@@ -91,16 +146,26 @@ if __name__ == "__main__":
     print("YFINANCE 401 ERROR DIAGNOSTIC TEST")
     print("=" * 50)
     
-    # Run tests
-    basic_ok = test_basic_yfinance()
-    session_ok = test_with_session()
-    multiple_ok = test_multiple_tickers()
+    # The basic test runs first, on its own: it must finish before the other probes swap
+    # yfinance's process-wide session for ours, and if Yahoo is already rate limiting us,
+    # the others would only add to it
+    basic_ok, basic_error = test_basic_yfinance()
+    if basic_error == "ratelimit":
+        print("\n✗ Rate limited on the basic test - circuit broken, skipping remaining tests.")
+        print("Wait a few minutes before running the diagnostics again.")
+        sys.exit(2)
+    
+    # Both remaining probes inject the same session, so they can run concurrently;
+    # their output lines may interleave
+    tests = [test_with_session, test_multiple_tickers]
+    with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+        session_ok, multiple_ok = executor.map(lambda test: test(), tests)
     
-    print("\n" + "=" * 50)
-    print("TEST RESULTS:")
-    print(f"Basic test: {'PASS' if basic_ok else 'FAIL'}")
-    print(f"Session test: {'PASS' if session_ok else 'FAIL'}")
-    print(f"Multiple ticker test: {'PASS' if multiple_ok else 'FAIL'}")
+    print("\n" + "=" * 50 + "\n"
+          "TEST RESULTS:\n"
+          f"Basic test: {'PASS' if basic_ok else 'FAIL'}\n"
+          f"Session test: {'PASS' if session_ok else 'FAIL'}\n"
+          f"Multiple ticker test: {'PASS' if multiple_ok else 'FAIL'}")
     
     if all([basic_ok, session_ok, multiple_ok]):
         print("\n✓ All tests passed! yfinance is working correctly.")